@@ -28,4 +28,4 @@ with gr.Blocks(title="BetaGomoku") as demo:
     demo.load(fn=None, js=BOARD_CLICK_JS)
 
 if __name__ == "__main__":
-    demo.launch(theme=gr.themes.Soft())
+    demo.queue().launch(theme=gr.themes.Soft())
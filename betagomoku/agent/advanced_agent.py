@@ -24,11 +24,21 @@ Key improvements over BaselineAgent:
 
 from __future__ import annotations
 
-import random
 from typing import Optional
 
 from betagomoku.agent.base import Agent
-from betagomoku.game.board import BOARD_SIZE, WIN_LENGTH, GomokuGameState
+from betagomoku.game.board import (
+    BOARD_SIZE,
+    DIRECTION_SHIFTS,
+    ON_BOARD_BITS,
+    POINT_GRID,
+    WIN_LENGTH,
+    ZOBRIST,
+    ZOBRIST_SIDE,
+    GomokuGameState,
+    makes_five,
+)
+from betagomoku.game.geom import NEIGH1_POINTS, RING2_POINTS
 from betagomoku.game.types import Player, Point
 
 # ---------------------------------------------------------------------------
@@ -57,6 +67,10 @@ DIRECTIONS = [(0, 1), (1, 0), (1, 1), (1, -1)]
 MAX_CANDIDATES_ROOT = 30
 MAX_CANDIDATES_INNER = 20
 
+# Transposition table kept across select_move calls and games; cleared once it
+# grows past this (a depth-6 game adds ~5-7k entries per move, ~35k in all)
+TT_MAX_ENTRIES = 100_000
+
 # Aspiration window: search depth ≥ 3 uses prev_score ± WINDOW first
 ASPIRATION_WINDOW = 500
 
@@ -87,102 +101,117 @@ LMR_QUIET_THRESHOLD = 6_000   # moves with heuristic >= this are never LMR-reduc
 BROKEN_FOUR_SCORE = 10_000
 
 # ---------------------------------------------------------------------------
-# Zobrist hashing (module-level, deterministic seed)
+# Zobrist hashing (tables live with the game state, deterministic seed)
 # ---------------------------------------------------------------------------
 
-_rng = random.Random(42)
-
-# ZOBRIST[row][col][player.value]: player.value = 1 (BLACK) or 2 (WHITE)
-ZOBRIST: list[list[list[int]]] = [
-    [[_rng.getrandbits(64) for _ in range(3)] for _ in range(BOARD_SIZE + 2)]
-    for _ in range(BOARD_SIZE + 2)
-]
-ZOBRIST_SIDE: int = _rng.getrandbits(64)  # XOR'd when it is WHITE's turn
-
-
 def _compute_hash(game_state: GomokuGameState) -> int:
-    """Compute the Zobrist hash from scratch for the current board + side to move."""
-    h = 0
-    for pt, player in game_state.board._grid.items():
-        h ^= ZOBRIST[pt.row][pt.col][player.value]
-    if game_state.current_player is Player.WHITE:
-        h ^= ZOBRIST_SIDE
-    return h
+    """Zobrist hash of the current board + side to move.
+
+    The state maintains it incrementally in apply_move/undo_move, so this is O(1).
+    """
+    return game_state.zobrist_hash
 
 
 # ---------------------------------------------------------------------------
 # Pattern utilities
 # ---------------------------------------------------------------------------
 
+# PATTERN_SCORES flattened to _PATTERN_LUT[count][open_ends] for count < WIN_LENGTH,
+# avoiding a tuple key build + hash per call in the evaluation hot loop
+_PATTERN_LUT: tuple[tuple[int, int, int], ...] = tuple(
+    tuple(PATTERN_SCORES.get((count, open_ends), 0) for open_ends in range(3))
+    for count in range(WIN_LENGTH)
+)
+
+
 def _pattern_score(count: int, open_ends: int) -> int:
     """Look up score for a consecutive group with given open ends."""
     if count >= WIN_LENGTH:
         return 100_000
-    return PATTERN_SCORES.get((count, open_ends), 0)
+    return _PATTERN_LUT[count][open_ends]
 
 
 # ---------------------------------------------------------------------------
 # Broken-four bonus (non-contiguous 4-in-5-window patterns)
 # ---------------------------------------------------------------------------
 
-def _broken_four_bonus(board, occupied: set[Point]) -> int:
+def _broken_four_bonus(board) -> int:
     """Score broken-four patterns: 4 player stones in a 5-cell window with 1 gap.
 
     A broken four like XX_XX is a direct win-in-1 threat (filling the gap wins
-    immediately) that the contiguous-group evaluator does not score.  Only counts
-    windows starting at an occupied stone to avoid double-counting.
+    immediately) that the contiguous-group evaluator does not score.  Each window
+    is counted once, from the stone at its start.
+
+    Every window of every direction is tested at once on the bitboards: bit i of
+    `p >> k*shift` is cell k of the window starting at bit i.  Counted windows
+    have stones at both ends and exactly one empty on-board cell in the middle
+    (a gap at either end would be a contiguous four, already scored).
 
     Returns positive for BLACK advantage, negative for WHITE advantage.
     """
-    if len(occupied) < 4:
+    if board.occupied_count < 4:
         return 0
 
-    bonus = 0
-    for dr, dc in DIRECTIONS:
-        for pt in occupied:
-            # Build a 5-cell window starting at this stone in direction (dr, dc)
-            cells: list[Optional[Player]] = []
-            r, c = pt.row, pt.col
-            valid = True
-            for _ in range(5):
-                p = Point(r, c)
-                if not board.is_on_grid(p):
-                    valid = False
-                    break
-                cells.append(board.get(p))
-                r += dr
-                c += dc
-
-            if not valid:
+    black = board.bits(Player.BLACK)
+    white = board.bits(Player.WHITE)
+    empty = ON_BOARD_BITS & ~(black | white)
+    counts = []
+    for p in (black, white):
+        n = 0
+        for shift in DIRECTION_SHIFTS.values():
+            ends = p & (p >> 4 * shift)
+            if not ends:
                 continue
+            a1, a2, a3 = p >> shift, p >> 2 * shift, p >> 3 * shift
+            e1, e2, e3 = empty >> shift, empty >> 2 * shift, empty >> 3 * shift
+            n += (ends & ((e1 & a2 & a3) | (a1 & e2 & a3) | (a1 & a2 & e3))).bit_count()
+        counts.append(n)
 
-            for player in (Player.BLACK, Player.WHITE):
-                # Only count windows where this stone belongs to 'player'
-                if cells[0] is not player:
-                    continue
-
-                player_count = sum(1 for x in cells if x is player)
-                opp_count = sum(1 for x in cells if x is not None and x is not player)
-
-                if player_count != 4 or opp_count > 0:
-                    continue
-
-                # Skip contiguous-4 patterns already scored by the main evaluator.
-                # Contiguous iff the 4 stone positions span exactly 4 cells.
-                indices = [i for i, x in enumerate(cells) if x is player]
-                if indices[-1] - indices[0] + 1 == 4:
-                    continue  # e.g., XXXX_ — already captured as (4, open_ends)
-
-                sign = 1 if player is Player.BLACK else -1
-                bonus += sign * BROKEN_FOUR_SCORE
-
-    return bonus
+    return BROKEN_FOUR_SCORE * (counts[0] - counts[1])
 
 
 # ---------------------------------------------------------------------------
 # Evaluation with fork detection
 # ---------------------------------------------------------------------------
 
+def _line_pattern_stats(board, player: Player) -> tuple[int, int, int]:
+    """Score every maximal run of `player`'s stones in all four directions.
+
+    Returns (pattern score sum, open-three count, four-or-longer count). Works on
+    the bitboards: run starts are stones with no own stone one step back, and
+    each pass of the loop extends all surviving runs by one cell at once, so the
+    runs ending at the current length -- and their open ends -- fall out as masks.
+    """
+    p = board.bits(player)
+    empty = ON_BOARD_BITS & ~(board.bits(Player.BLACK) | board.bits(Player.WHITE))
+    score = open3 = four = 0
+    for shift in DIRECTION_SHIFTS.values():
+        open_before = empty << shift
+        alive = p & ~(p << shift)  # run starts, indexed by their first cell
+        length = 1
+        while alive:
+            step = length * shift
+            nxt = p >> step
+            ends = alive & ~nxt  # runs of exactly `length`
+            if ends:
+                open_after = empty >> step
+                two = (ends & open_before & open_after).bit_count()
+                one = (ends & (open_before ^ open_after)).bit_count()
+                total = ends.bit_count()
+                if length >= WIN_LENGTH:
+                    score += 100_000 * total
+                else:
+                    lut = _PATTERN_LUT[length]
+                    score += lut[2] * two + lut[1] * one + lut[0] * (total - two - one)
+                if length == 3:
+                    open3 += two
+                elif length >= 4:
+                    four += total
+            alive &= nxt
+            length += 1
+    return score, open3, four
+
+
 def evaluate(game_state: GomokuGameState) -> int:
     """Static evaluation. Positive = BLACK advantage.
 
@@ -197,71 +226,9 @@ def evaluate(game_state: GomokuGameState) -> int:
         return 0
 
     board = game_state.board
-    occupied = {m.point for m in game_state.moves}
-    score = 0
-
-    # Counters for fork bonus detection
-    black_open3 = 0
-    black_four = 0
-    white_open3 = 0
-    white_four = 0
-
-    for dr, dc in DIRECTIONS:
-        visited: set[Point] = set()
-
-        for pt in occupied:
-            if pt in visited:
-                continue
-            player = board.get(pt)
-            if player is None:
-                continue
-
-            # Walk backward to find the start of the group in this direction
-            sr, sc = pt.row, pt.col
-            while True:
-                pr, pc = sr - dr, sc - dc
-                p = Point(pr, pc)
-                if not board.is_on_grid(p) or board.get(p) is not player:
-                    break
-                sr, sc = pr, pc
-
-            if Point(sr, sc) in visited:
-                continue
-
-            # Count consecutive stones in the forward direction
-            count = 0
-            cr, cc = sr, sc
-            while True:
-                p = Point(cr, cc)
-                if not board.is_on_grid(p) or board.get(p) is not player:
-                    break
-                visited.add(p)
-                count += 1
-                cr += dr
-                cc += dc
-
-            # Count open ends
-            open_ends = 0
-            before = Point(sr - dr, sc - dc)
-            if board.is_on_grid(before) and board.get(before) is None:
-                open_ends += 1
-            after = Point(sr + dr * count, sc + dc * count)
-            if board.is_on_grid(after) and board.get(after) is None:
-                open_ends += 1
-
-            ps = _pattern_score(count, open_ends)
-            if player is Player.BLACK:
-                score += ps
-                if count == 3 and open_ends == 2:
-                    black_open3 += 1
-                elif count >= 4:
-                    black_four += 1
-            else:
-                score -= ps
-                if count == 3 and open_ends == 2:
-                    white_open3 += 1
-                elif count >= 4:
-                    white_four += 1
+    black_score, black_open3, black_four = _line_pattern_stats(board, Player.BLACK)
+    white_score, white_open3, white_four = _line_pattern_stats(board, Player.WHITE)
+    score = black_score - white_score
 
     # Fork bonuses: reward (penalize) positions with multiple simultaneous threats
     if black_open3 >= 2:
@@ -274,7 +241,7 @@ def evaluate(game_state: GomokuGameState) -> int:
         score -= DOUBLE_THREAT_BONUS
 
     # Broken-four bonus: score non-contiguous 4-in-5-window winning threats
-    score += _broken_four_bonus(board, occupied)
+    score += _broken_four_bonus(board)
 
     return score
 
@@ -305,19 +272,19 @@ def _four_extension_squares(game_state: GomokuGameState, player: Player) -> list
             sr, sc = pt.row, pt.col
             while True:
                 pr, pc = sr - dr, sc - dc
-                p = Point(pr, pc)
+                p = POINT_GRID[pr][pc]
                 if not board.is_on_grid(p) or board.get(p) is not player:
                     break
                 sr, sc = pr, pc
 
-            if Point(sr, sc) in visited:
+            if POINT_GRID[sr][sc] in visited:
                 continue
 
             # Count consecutive forward
             count = 0
             cr, cc = sr, sc
             while True:
-                p = Point(cr, cc)
+                p = POINT_GRID[cr][cc]
                 if not board.is_on_grid(p) or board.get(p) is not player:
                     break
                 visited.add(p)
@@ -327,10 +294,10 @@ def _four_extension_squares(game_state: GomokuGameState, player: Player) -> list
 
             # Only care about exactly-4 groups (5+ is already a win)
             if count == 4:
-                before = Point(sr - dr, sc - dc)
+                before = POINT_GRID[sr - dr][sc - dc]
                 if board.is_on_grid(before) and board.is_empty(before):
                     squares.append(before)
-                after = Point(cr, cc)  # one past the last stone
+                after = POINT_GRID[cr][cc]  # one past the last stone
                 if board.is_on_grid(after) and board.is_empty(after):
                     squares.append(after)
 
@@ -362,19 +329,19 @@ def _open_three_squares(
             sr, sc = pt.row, pt.col
             while True:
                 pr, pc = sr - dr, sc - dc
-                p = Point(pr, pc)
+                p = POINT_GRID[pr][pc]
                 if not board.is_on_grid(p) or board.get(p) is not player:
                     break
                 sr, sc = pr, pc
 
-            if Point(sr, sc) in visited:
+            if POINT_GRID[sr][sc] in visited:
                 continue
 
             # Count consecutive forward
             n = 0
             cr, cc = sr, sc
             while True:
-                p = Point(cr, cc)
+                p = POINT_GRID[cr][cc]
                 if not board.is_on_grid(p) or board.get(p) is not player:
                     break
                 visited.add(p)
@@ -383,8 +350,8 @@ def _open_three_squares(
                 cc += dc
 
             if n == 3:
-                before = Point(sr - dr, sc - dc)
-                after = Point(cr, cc)
+                before = POINT_GRID[sr - dr][sc - dc]
+                after = POINT_GRID[cr][cc]
                 open_before = board.is_on_grid(before) and board.is_empty(before)
                 open_after = board.is_on_grid(after) and board.is_empty(after)
                 if open_before and open_after:
@@ -403,34 +370,7 @@ def _is_winning_placement(game_state: GomokuGameState, move: Point, player: Play
     board = game_state.board
     if not board.is_on_grid(move) or not board.is_empty(move):
         return False
-
-    for dr, dc in DIRECTIONS:
-        count = 1
-
-        # Forward
-        r, c = move.row + dr, move.col + dc
-        while True:
-            p = Point(r, c)
-            if not board.is_on_grid(p) or board.get(p) is not player:
-                break
-            count += 1
-            r += dr
-            c += dc
-
-        # Backward
-        r, c = move.row - dr, move.col - dc
-        while True:
-            p = Point(r, c)
-            if not board.is_on_grid(p) or board.get(p) is not player:
-                break
-            count += 1
-            r -= dr
-            c -= dc
-
-        if count >= WIN_LENGTH:
-            return True
-
-    return False
+    return makes_five(board.bits(player), move)
 
 
 # ---------------------------------------------------------------------------
@@ -473,18 +413,12 @@ def generate_candidates(game_state: GomokuGameState) -> list[Point]:
     dist2: set[Point] = set()
 
     for pt in occupied:
-        for dr in range(-2, 3):
-            for dc in range(-2, 3):
-                if dr == 0 and dc == 0:
-                    continue
-                nr, nc = pt.row + dr, pt.col + dc
-                np_ = Point(nr, nc)
-                if not board.is_on_grid(np_) or not board.is_empty(np_):
-                    continue
-                if abs(dr) <= 1 and abs(dc) <= 1:
-                    dist1.add(np_)
-                else:
-                    dist2.add(np_)
+        for np_ in NEIGH1_POINTS[pt]:
+            if board.is_empty(np_):
+                dist1.add(np_)
+        for np_ in RING2_POINTS[pt]:
+            if board.is_empty(np_):
+                dist2.add(np_)
 
     dist2 -= dist1
     candidates = list(dist1) + list(dist2)
@@ -535,26 +469,26 @@ def _move_heuristic(game_state: GomokuGameState, move: Point) -> int:
             # Forward
             cr, cc = move.row + dr, move.col + dc
             while True:
-                p = Point(cr, cc)
+                p = POINT_GRID[cr][cc]
                 if not board.is_on_grid(p) or board.get(p) is not player:
                     break
                 count += 1
                 cr += dr
                 cc += dc
-            fwd = Point(cr, cc)
+            fwd = POINT_GRID[cr][cc]
             if board.is_on_grid(fwd) and board.get(fwd) is None:
                 open_ends += 1
 
             # Backward
             cr, cc = move.row - dr, move.col - dc
             while True:
-                p = Point(cr, cc)
+                p = POINT_GRID[cr][cc]
                 if not board.is_on_grid(p) or board.get(p) is not player:
                     break
                 count += 1
                 cr -= dr
                 cc -= dc
-            bwd = Point(cr, cc)
+            bwd = POINT_GRID[cr][cc]
             if board.is_on_grid(bwd) and board.get(bwd) is None:
                 open_ends += 1
 
@@ -899,7 +833,7 @@ class AdvancedAgent(Agent):
     broken-four evaluation, and open-3 forced response. Default depth = 6.
 
     Search algorithm summary:
-    - Iterative deepening: depths 1 .. self.depth, reusing TT across iterations
+    - Iterative deepening: depths 1 .. self.depth, reusing TT across iterations and moves
     - Aspiration windows: start with score ± WINDOW; widen on fail-low/high
     - PVS: full window on first move, null window on rest, re-search if needed
     - LMR: reduce depth-1 for late quiet moves, re-search at full depth if needed
@@ -913,6 +847,9 @@ class AdvancedAgent(Agent):
 
     def __init__(self, depth: int = 6) -> None:
         self.depth = depth
+        # Zobrist hash -> (depth, flag, score, best_move); shared by every search
+        # this agent runs, so positions recurring across moves and games hit.
+        self.tt: dict = {}
 
     @property
     def name(self) -> str:
@@ -942,7 +879,9 @@ class AdvancedAgent(Agent):
             capped = initial_order[:MAX_CANDIDATES_ROOT]
             candidates = list(dict.fromkeys(forcing_moves + capped))
 
-        tt: dict = {}
+        if len(self.tt) > TT_MAX_ENTRIES:
+            self.tt.clear()
+        tt = self.tt
         history: dict[Point, int] = {}
         killers: list[list[Optional[Point]]] = [[None, None] for _ in range(self.depth + 2)]
         best_move: Optional[Point] = candidates[0] if candidates else None
@@ -6,7 +6,8 @@ import math
 from typing import Optional
 
 from betagomoku.agent.base import Agent
-from betagomoku.game.board import BOARD_SIZE, WIN_LENGTH, GomokuGameState
+from betagomoku.game.board import BOARD_SIZE, POINT_GRID, WIN_LENGTH, GomokuGameState
+from betagomoku.game.geom import NEIGH2_POINTS
 from betagomoku.game.types import Player, Point
 
 # ---------------------------------------------------------------------------
@@ -93,12 +94,12 @@ def evaluate(game_state: GomokuGameState) -> int:
             sr, sc = pt.row, pt.col
             while True:
                 pr, pc = sr - dr, sc - dc
-                p = Point(pr, pc)
+                p = POINT_GRID[pr][pc]
                 if not board.is_on_grid(p) or board.get(p) is not player:
                     break
                 sr, sc = pr, pc
 
-            start = Point(sr, sc)
+            start = POINT_GRID[sr][sc]
             if start in visited:
                 continue
 
@@ -106,7 +107,7 @@ def evaluate(game_state: GomokuGameState) -> int:
             count = 0
             curr_r, curr_c = sr, sc
             while True:
-                p = Point(curr_r, curr_c)
+                p = POINT_GRID[curr_r][curr_c]
                 if not board.is_on_grid(p) or board.get(p) is not player:
                     break
                 visited.add(p)
@@ -116,10 +117,10 @@ def evaluate(game_state: GomokuGameState) -> int:
 
             # Count open ends
             open_ends = 0
-            before = Point(sr - dr, sc - dc)
+            before = POINT_GRID[sr - dr][sc - dc]
             if board.is_on_grid(before) and board.get(before) is None:
                 open_ends += 1
-            after = Point(sr + dr * count, sc + dc * count)
+            after = POINT_GRID[sr + dr * count][sc + dc * count]
             if board.is_on_grid(after) and board.get(after) is None:
                 open_ends += 1
 
@@ -150,14 +151,9 @@ def generate_candidates(game_state: GomokuGameState) -> list[Point]:
     candidates: set[Point] = set()
 
     for pt in occupied:
-        for dr in range(-2, 3):
-            for dc in range(-2, 3):
-                if dr == 0 and dc == 0:
-                    continue
-                nr, nc = pt.row + dr, pt.col + dc
-                np = Point(nr, nc)
-                if board.is_on_grid(np) and board.is_empty(np):
-                    candidates.add(np)
+        for np in NEIGH2_POINTS[pt]:
+            if board.is_empty(np):
+                candidates.add(np)
 
     return list(candidates)
 
@@ -182,28 +178,28 @@ def _move_heuristic(game_state: GomokuGameState, move: Point) -> int:
             # Forward
             cr, cc = move.row + dr, move.col + dc
             while True:
-                p = Point(cr, cc)
+                p = POINT_GRID[cr][cc]
                 if not board.is_on_grid(p) or board.get(p) is not player:
                     break
                 count += 1
                 cr += dr
                 cc += dc
             # Check if forward end is open
-            end_fwd = Point(cr, cc)
+            end_fwd = POINT_GRID[cr][cc]
             if board.is_on_grid(end_fwd) and board.get(end_fwd) is None:
                 open_ends += 1
 
             # Backward
             cr, cc = move.row - dr, move.col - dc
             while True:
-                p = Point(cr, cc)
+                p = POINT_GRID[cr][cc]
                 if not board.is_on_grid(p) or board.get(p) is not player:
                     break
                 count += 1
                 cr -= dr
                 cc -= dc
             # Check if backward end is open
-            end_bwd = Point(cr, cc)
+            end_bwd = POINT_GRID[cr][cc]
             if board.is_on_grid(end_bwd) and board.get(end_bwd) is None:
                 open_ends += 1
 
@@ -284,12 +280,10 @@ def negamax(
     return best
 
 
-def _tt_key(game_state: GomokuGameState) -> tuple:
-    """Create a hashable key for the transposition table from the board state."""
-    return (
-        frozenset(game_state.board._grid.items()),
-        game_state.current_player,
-    )
+def _tt_key(game_state: GomokuGameState) -> int:
+    """Transposition-table key: the state's incrementally maintained Zobrist hash
+    (stones + side to move)."""
+    return game_state.zobrist_hash
 
 
 # ---------------------------------------------------------------------------
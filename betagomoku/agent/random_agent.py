@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import random
+from typing import Optional
 
 from betagomoku.game.board import GomokuGameState
 from betagomoku.game.types import Point
@@ -9,7 +10,11 @@ from .base import Agent
 
 
 class RandomAgent(Agent):
+    def __init__(self, seed: Optional[int] = None) -> None:
+        # Own RNG so a seeded agent replays the same moves regardless of other callers
+        self._rng = random.Random(seed)
+
     def select_move(self, game_state: GomokuGameState) -> Point:
         moves = game_state.legal_moves()
         assert moves, "No legal moves available"
-        return random.choice(moves)
+        return self._rng.choice(moves)
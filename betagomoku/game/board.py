@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import random
+from bisect import bisect_left, insort
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Iterable, Optional
 
 from .types import Player, Point
 
@@ -11,6 +13,87 @@ WIN_LENGTH = 5
 # Column labels: A-O (skipping no letters for 15x15)
 COL_LABELS = "ABCDEFGHIJKLMNO"
 
+# Zobrist keys (deterministic seed). ZOBRIST[row][col][player.value] is XOR'd
+# into the position hash when a stone is placed; ZOBRIST_SIDE when WHITE is to move.
+_zobrist_rng = random.Random(42)
+ZOBRIST: list[list[list[int]]] = [
+    [[_zobrist_rng.getrandbits(64) for _ in range(3)] for _ in range(BOARD_SIZE + 2)]
+    for _ in range(BOARD_SIZE + 2)
+]
+ZOBRIST_SIDE: int = _zobrist_rng.getrandbits(64)
+
+
+# Black's fifth stone is the earliest possible win: no five can exist before then
+_MIN_WINNING_MOVES = 2 * WIN_LENGTH - 1
+
+# Canonical Point for every (row, col) from 0 to BOARD_SIZE + 1: the board plus
+# a one-cell border, the furthest a line walk steps off it. POINT_GRID[row][col]
+# reuses these instead of allocating a new Point per step.
+POINT_GRID: tuple[tuple[Point, ...], ...] = tuple(
+    tuple(Point(r, c) for c in range(BOARD_SIZE + 2)) for r in range(BOARD_SIZE + 2)
+)
+
+# Every on-grid point, row-major from A1. Built once and shared by all callers.
+ALL_POINTS: tuple[Point, ...] = tuple(
+    POINT_GRID[r][c] for r in range(1, BOARD_SIZE + 1) for c in range(1, BOARD_SIZE + 1)
+)
+
+# Bitboard layout: a point is bit (row * BIT_STRIDE + col). Column 0 of every row
+# is never on the board, so it separates rows and a shifted line can't wrap onto
+# the next one. Shifting by DIRECTION_SHIFTS[(dr, dc)] steps one cell along a line.
+BIT_STRIDE = BOARD_SIZE + 1
+ON_BOARD_BITS: int = sum(1 << (p.row * BIT_STRIDE + p.col) for p in ALL_POINTS)
+DIRECTION_SHIFTS: dict[tuple[int, int], int] = {
+    (0, 1): 1,
+    (1, 0): BIT_STRIDE,
+    (1, 1): BIT_STRIDE + 1,
+    (1, -1): BIT_STRIDE - 1,
+}
+
+# For each point: (shift, mask) per direction, where mask covers the on-board
+# cells of that line within WIN_LENGTH - 1 of the point -- every cell a
+# five through the point can use.
+_FIVE_LINES: dict[Point, tuple[tuple[int, int], ...]] = {
+    p: tuple(
+        (
+            shift,
+            sum(
+                1 << ((p.row + k * dr) * BIT_STRIDE + p.col + k * dc)
+                for k in range(1 - WIN_LENGTH, WIN_LENGTH)
+                if 1 <= p.row + k * dr <= BOARD_SIZE and 1 <= p.col + k * dc <= BOARD_SIZE
+            ),
+        )
+        for (dr, dc), shift in DIRECTION_SHIFTS.items()
+    )
+    for p in ALL_POINTS
+}
+
+
+def makes_five(bits: int, point: Point) -> bool:
+    """Whether the stones in `bits` plus one at `point` hold five in a row through `point`.
+
+    Works on the bitboard: a bit that survives ANDing the line with itself shifted
+    1..4 steps marks the start of five consecutive stones.
+    """
+    bits |= 1 << (point.row * BIT_STRIDE + point.col)
+    for shift, mask in _FIVE_LINES[point]:
+        line = bits & mask
+        run = line & (line >> shift)
+        run &= run >> 2 * shift
+        if run & (line >> 4 * shift):
+            return True
+    return False
+
+
+# Point <-> coordinate string for every on-grid point. The column is a single
+# letter, so the upper- and lower-case spellings are the only parse variants.
+_POINT_TO_COORD: dict[Point, str] = {p: f"{COL_LABELS[p.col - 1]}{p.row}" for p in ALL_POINTS}
+_COORD_TO_POINT: dict[str, Point] = {
+    spelling: p
+    for p, coord in _POINT_TO_COORD.items()
+    for spelling in (coord, coord.lower())
+}
+
 
 def parse_coordinate(text: str) -> Optional[Point]:
     """Parse a coordinate string like 'E5' or 'H12' into a Point.
@@ -18,29 +101,18 @@ def parse_coordinate(text: str) -> Optional[Point]:
     Column is a letter A-O, row is a number 1-15.
     Returns None if the string is invalid.
     """
-    text = text.strip().upper()
-    if len(text) < 2 or len(text) > 3:
-        return None
-    col_char = text[0]
-    row_str = text[1:]
-    if col_char not in COL_LABELS:
-        return None
-    try:
-        row = int(row_str)
-    except ValueError:
-        return None
-    if not (1 <= row <= BOARD_SIZE):
-        return None
-    col = COL_LABELS.index(col_char) + 1
-    return Point(row, col)
+    return _COORD_TO_POINT.get(text.strip())
 
 
 def format_point(point: Point) -> str:
     """Format a Point as a coordinate string like 'E5'."""
-    return f"{COL_LABELS[point.col - 1]}{point.row}"
+    coord = _POINT_TO_COORD.get(point)
+    if coord is None:  # off-grid; only reached from diagnostics
+        coord = f"{COL_LABELS[point.col - 1]}{point.row}"
+    return coord
 
 
-@dataclass
+@dataclass(slots=True)
 class Move:
     point: Point
     player: Player
@@ -55,13 +127,34 @@ class Board:
 
     def __init__(self) -> None:
         self._grid: dict[Point, Player] = {}
+        # Per-colour bitboards indexed by player.value (slot 0 unused), kept in
+        # step with _grid for whole-board line scans
+        self._bits: list[int] = [0, 0, 0]
+        # XOR of the Zobrist keys of every stone; place/remove keep it current
+        self.zobrist_hash = 0
+
+    def clone(self) -> Board:
+        """Return an independent copy of this board."""
+        other = Board.__new__(Board)
+        other._grid = self._grid.copy()
+        other._bits = self._bits.copy()
+        other.zobrist_hash = self.zobrist_hash
+        return other
 
     def place(self, point: Point, player: Player) -> None:
         assert self.is_empty(point), f"{format_point(point)} is occupied"
         self._grid[point] = player
+        self._bits[player.value] |= 1 << (point.row * BIT_STRIDE + point.col)
+        self.zobrist_hash ^= ZOBRIST[point.row][point.col][player.value]
 
     def remove(self, point: Point) -> None:
-        del self._grid[point]
+        player = self._grid.pop(point)
+        self._bits[player.value] ^= 1 << (point.row * BIT_STRIDE + point.col)
+        self.zobrist_hash ^= ZOBRIST[point.row][point.col][player.value]
+
+    def bits(self, player: Player) -> int:
+        """Bitboard of `player`'s stones (see BIT_STRIDE for the layout)."""
+        return self._bits[player.value]
 
     def get(self, point: Point) -> Optional[Player]:
         return self._grid.get(point)
@@ -86,6 +179,37 @@ class GomokuGameState:
         self.moves: list[Move] = []
         self._winner: Optional[Player] = None
         self._is_over = False
+        # Board stones' hash plus ZOBRIST_SIDE when WHITE is to move; updated by apply_move/undo_move
+        self.zobrist_hash = 0
+        # Empty points in row-major order (Point tuples sort that way), kept in
+        # step with the board so legal_moves() needn't rescan it
+        self._empty: list[Point] = list(ALL_POINTS)
+
+    def clone(self) -> GomokuGameState:
+        """Return an independent copy of this state without re-running __init__."""
+        other = GomokuGameState.__new__(GomokuGameState)
+        other.board = self.board.clone()
+        other.current_player = self.current_player
+        other.moves = list(self.moves)
+        other._winner = self._winner
+        other._is_over = self._is_over
+        other.zobrist_hash = self.zobrist_hash
+        other._empty = self._empty.copy()
+        return other
+
+    @classmethod
+    def from_coords(cls, coords: Iterable[str]) -> GomokuGameState:
+        """Build a state by playing the given coordinates (e.g. "H8") alternately from Black.
+
+        Raises ValueError on an unparseable coordinate.
+        """
+        game = cls()
+        for coord in coords:
+            point = _COORD_TO_POINT.get(coord.strip())
+            if point is None:
+                raise ValueError(f"Invalid coordinate: {coord!r}")
+            game.apply_move(point)
+        return game
 
     @property
     def is_over(self) -> bool:
@@ -102,12 +226,7 @@ class GomokuGameState:
     def legal_moves(self) -> list[Point]:
         if self._is_over:
             return []
-        return [
-            Point(r, c)
-            for r in range(1, BOARD_SIZE + 1)
-            for c in range(1, BOARD_SIZE + 1)
-            if self.board.is_empty(Point(r, c))
-        ]
+        return self._empty.copy()
 
     def apply_move(self, point: Point, elapsed: Optional[float] = None) -> None:
         """Place a stone for the current player and advance the turn.
@@ -120,10 +239,14 @@ class GomokuGameState:
 
         player = self.current_player
         self.board.place(point, player)
-        move = Move(point=point, player=player, elapsed=elapsed)
+        del self._empty[bisect_left(self._empty, point)]
+        move = Move(point, player, elapsed)
         self.moves.append(move)
+        self.zobrist_hash = self.board.zobrist_hash
+        if player is Player.BLACK:
+            self.zobrist_hash ^= ZOBRIST_SIDE
 
-        if self._check_win(point, player):
+        if len(self.moves) >= _MIN_WINNING_MOVES and self._check_win(point, player):
             self._winner = player
             self._is_over = True
         elif self.board.occupied_count == BOARD_SIZE * BOARD_SIZE:
@@ -137,6 +260,10 @@ class GomokuGameState:
             return None
         move = self.moves.pop()
         self.board.remove(move.point)
+        insort(self._empty, move.point)
+        self.zobrist_hash = self.board.zobrist_hash
+        if move.player is Player.WHITE:
+            self.zobrist_hash ^= ZOBRIST_SIDE
         self.current_player = move.player
         self._winner = None
         self._is_over = False
@@ -144,23 +271,4 @@ class GomokuGameState:
 
     def _check_win(self, point: Point, player: Player) -> bool:
         """Check if placing at `point` creates 5-in-a-row for `player`."""
-        directions = [(0, 1), (1, 0), (1, 1), (1, -1)]
-        for dr, dc in directions:
-            count = 1
-            # Count forward
-            for step in range(1, WIN_LENGTH):
-                r, c = point.row + dr * step, point.col + dc * step
-                p = Point(r, c)
-                if not self.board.is_on_grid(p) or self.board.get(p) is not player:
-                    break
-                count += 1
-            # Count backward
-            for step in range(1, WIN_LENGTH):
-                r, c = point.row - dr * step, point.col - dc * step
-                p = Point(r, c)
-                if not self.board.is_on_grid(p) or self.board.get(p) is not player:
-                    break
-                count += 1
-            if count >= WIN_LENGTH:
-                return True
-        return False
+        return makes_five(self.board.bits(player), point)
@@ -0,0 +1,38 @@
+"""Precomputed neighbourhood offsets and neighbour tables shared by candidate generation."""
+
+from __future__ import annotations
+
+from .board import ALL_POINTS
+from .types import Point
+
+# (dr, dc) offsets within Chebyshev distance 2 / 1 of a cell, excluding the cell
+# itself. The tuple keeps row-major order for deterministic iteration.
+NEIGH2_OFFSETS: tuple[tuple[int, int], ...] = tuple(
+    (dr, dc) for dr in range(-2, 3) for dc in range(-2, 3) if (dr, dc) != (0, 0)
+)
+NEIGH2: frozenset[tuple[int, int]] = frozenset(NEIGH2_OFFSETS)
+NEIGH1: frozenset[tuple[int, int]] = frozenset(
+    (dr, dc) for dr, dc in NEIGH2_OFFSETS if abs(dr) <= 1 and abs(dc) <= 1
+)
+
+_ON_GRID = frozenset(ALL_POINTS)
+
+
+def _on_grid_neighbours(offsets: tuple[tuple[int, int], ...]) -> dict[Point, tuple[Point, ...]]:
+    table: dict[Point, tuple[Point, ...]] = {}
+    for p in ALL_POINTS:
+        near = (Point(p.row + dr, p.col + dc) for dr, dc in offsets)
+        table[p] = tuple(q for q in near if q in _ON_GRID)
+    return table
+
+
+# Point -> its on-grid neighbours (in NEIGH2_OFFSETS order) within distance 2,
+# at distance 1, and at exactly distance 2. Candidate generation walks these
+# instead of building and bounds-checking Points per offset.
+NEIGH2_POINTS: dict[Point, tuple[Point, ...]] = _on_grid_neighbours(NEIGH2_OFFSETS)
+NEIGH1_POINTS: dict[Point, tuple[Point, ...]] = _on_grid_neighbours(
+    tuple(o for o in NEIGH2_OFFSETS if o in NEIGH1)
+)
+RING2_POINTS: dict[Point, tuple[Point, ...]] = _on_grid_neighbours(
+    tuple(o for o in NEIGH2_OFFSETS if o not in NEIGH1)
+)
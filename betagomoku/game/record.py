@@ -8,10 +8,19 @@ from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
-from .board import GomokuGameState, format_point, parse_coordinate
+from .board import BOARD_SIZE, POINT_GRID, GomokuGameState, format_point, parse_coordinate
+from .types import Point
+
+try:
+    import orjson
+except ImportError:  # optional speedup; the stdlib writes the same format
+    orjson = None
 
 SAVED_GAMES_DIR = Path(__file__).resolve().parents[2] / "saved_games"
 
+# (directory mtime_ns, sorted filenames) from the last list_saved_games() scan
+_listing_cache: Optional[tuple[int, list[str]]] = None
+
 
 def _ensure_dir() -> None:
     SAVED_GAMES_DIR.mkdir(exist_ok=True)
@@ -22,8 +31,14 @@ def save_game(
     black_name: str,
     white_name: str,
     result: str = "",
+    hash_suffix: str = "",
 ) -> str:
-    """Save a game to a JSON file. Returns the filename."""
+    """Save a game to a JSON file. Returns the filename.
+
+    hash_suffix: optional position key (e.g. the Zobrist hash) appended to the
+    filename. When given, an existing save with the same players, suffix, moves
+    and result is reused instead of writing a duplicate file.
+    """
     _ensure_dir()
     if not result:
         if game.is_over:
@@ -36,9 +51,24 @@ def save_game(
 
     moves = [format_point(m.point) for m in game.moves]
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    filename = f"{timestamp}_{black_name}_vs_{white_name}.json"
+    stem = f"{black_name}_vs_{white_name}"
+    if hash_suffix:
+        stem = f"{stem}_{hash_suffix}"
     # Sanitize filename
-    filename = filename.replace(" ", "_").replace("(", "").replace(")", "")
+    stem = stem.replace(" ", "_").replace("(", "").replace(")", "")
+    filename = f"{timestamp}_{stem}.json"
+
+    if hash_suffix:
+        for existing in sorted(SAVED_GAMES_DIR.glob(f"*_{stem}.json"), reverse=True):
+            prior = load_game(existing.name)
+            if prior.get("moves") == moves and prior.get("result") == result:
+                return existing.name
+        # Same players and position saved again within the same second. The
+        # counter goes before the stem so the lookup above still finds this file.
+        n = 2
+        while (SAVED_GAMES_DIR / filename).exists():
+            filename = f"{timestamp}_{n}_{stem}.json"
+            n += 1
 
     record = {
         "date": datetime.now().isoformat(),
@@ -46,28 +76,75 @@ def save_game(
         "white": white_name,
         "result": result,
         "moves": moves,
+        # Same moves as [row, col] pairs, so readers need not parse coordinates
+        "moves_rc": [[m.point.row, m.point.col] for m in game.moves],
     }
 
     filepath = SAVED_GAMES_DIR / filename
-    with open(filepath, "w") as f:
-        json.dump(record, f, indent=2)
-
+    if orjson is not None:
+        filepath.write_bytes(orjson.dumps(record, option=orjson.OPT_INDENT_2))
+    else:
+        with open(filepath, "w") as f:
+            json.dump(record, f, indent=2)
+
+    # Don't rely on the directory mtime alone; it can be coarse on some filesystems
+    global _listing_cache
+    _listing_cache = None
     return filename
 
 
 def load_game(filename: str) -> dict:
     """Load a game record from a JSON file. Returns the parsed dict."""
     filepath = SAVED_GAMES_DIR / filename
+    if orjson is not None:
+        return orjson.loads(filepath.read_bytes())
     with open(filepath) as f:
         return json.load(f)
 
 
 def list_saved_games() -> list[str]:
-    """Return sorted list of saved game filenames (newest first)."""
+    """Return sorted list of saved game filenames (newest first).
+
+    The listing is cached until the directory's mtime changes or a game is saved.
+    """
+    global _listing_cache
     _ensure_dir()
-    files = [f for f in os.listdir(SAVED_GAMES_DIR) if f.endswith(".json")]
-    files.sort(reverse=True)
-    return files
+    mtime = os.stat(SAVED_GAMES_DIR).st_mtime_ns
+    cached = _listing_cache
+    if cached is not None and cached[0] == mtime:
+        return list(cached[1])
+    with os.scandir(SAVED_GAMES_DIR) as it:
+        files = sorted(
+            (e.name for e in it if e.name.endswith(".json") and e.is_file()),
+            reverse=True,
+        )
+    _listing_cache = (mtime, files)
+    return list(files)
+
+
+def record_points(record: dict, stop: Optional[int] = None) -> list[Optional[Point]]:
+    """Return the record's moves as Points (None for an unreadable move).
+
+    Uses the "moves_rc" pairs when present; older records only have "moves".
+    stop: convert only the first `stop` moves.
+    """
+    moves = record.get("moves", [])
+    pairs = record.get("moves_rc")
+    if pairs is not None and len(pairs) == len(moves):
+        return [_pair_to_point(pair) for pair in pairs[:stop]]
+    return [parse_coordinate(coord) for coord in moves[:stop]]
+
+
+def _pair_to_point(pair) -> Optional[Point]:
+    """Point for a [row, col] pair from a record, or None if it is not on the board."""
+    if not isinstance(pair, list) or len(pair) != 2:
+        return None
+    row, col = pair
+    if type(row) is not int or type(col) is not int:
+        return None
+    if not (1 <= row <= BOARD_SIZE and 1 <= col <= BOARD_SIZE):
+        return None
+    return POINT_GRID[row][col]
 
 
 def replay_to_move(record: dict, move_index: int) -> GomokuGameState:
@@ -76,9 +153,7 @@ def replay_to_move(record: dict, move_index: int) -> GomokuGameState:
     move_index = -1 means empty board, 0 means first move, etc.
     """
     game = GomokuGameState()
-    moves = record.get("moves", [])
-    for i in range(min(move_index + 1, len(moves))):
-        point = parse_coordinate(moves[i])
+    for point in record_points(record, max(move_index + 1, 0)):
         if point is not None:
             game.apply_move(point)
     return game
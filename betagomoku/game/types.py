@@ -10,10 +10,19 @@ class Player(enum.Enum):
 
     @property
     def other(self) -> Player:
-        return Player.WHITE if self is Player.BLACK else Player.BLACK
+        return self._other
 
     def __str__(self) -> str:
-        return self.name.capitalize()
+        return self._label
+
+
+# Opponent of each colour, stored on the members so `.other` is one attribute load
+Player.BLACK._other = Player.WHITE
+Player.WHITE._other = Player.BLACK
+# Display name ("Black"/"White"), formatted once rather than on every str()
+for _player in Player:
+    _player._label = _player.name.capitalize()
+del _player
 
 
 class Point(NamedTuple):
@@ -5,7 +5,7 @@ from __future__ import annotations
 import math
 from typing import Optional
 
-from betagomoku.game.board import BOARD_SIZE, COL_LABELS, GomokuGameState
+from betagomoku.game.board import ALL_POINTS, BOARD_SIZE, COL_LABELS, GomokuGameState
 from betagomoku.game.types import Player, Point
 
 # Layout constants
@@ -79,25 +79,10 @@ def render_eval_bar(eval_score: int) -> str:
     return "\n".join(parts)
 
 
-def render_board_svg(
-    game_state: GomokuGameState,
-    clickable: bool = True,
-    highlight_last: bool = True,
-    game_over_message: str = "",
-    eval_score: Optional[int] = None,
-) -> str:
-    """Render the board as an SVG string wrapped in a div with click JS."""
+def _static_board_svg() -> str:
+    """SVG header, background, grid, star points and labels -- identical for every render."""
     parts: list[str] = []
 
-    # Wrapper div — use flex layout when eval bar is present
-    if eval_score is not None:
-        parts.append(
-            f'<div id="gomoku-board-wrap" style="display:inline-flex;align-items:stretch;gap:6px;">'
-        )
-        parts.append(render_eval_bar(eval_score))
-    else:
-        parts.append(f'<div id="gomoku-board-wrap" style="display:inline-block;position:relative;">')
-
     # SVG header
     parts.append(
         f'<svg xmlns="http://www.w3.org/2000/svg" '
@@ -162,66 +147,113 @@ def render_board_svg(
             f'{r}</text>'
         )
 
+    return "\n".join(parts)
+
+
+def _stone_svg(pt: Point, player: Player) -> str:
+    x, y = _coord(pt.row, pt.col)
+    fill = BLACK_STONE if player is Player.BLACK else WHITE_STONE
+    stroke = "none" if player is Player.BLACK else WHITE_STROKE
+    return (
+        f'<circle cx="{x}" cy="{y}" r="{STONE_RADIUS}" '
+        f'fill="{fill}" stroke="{stroke}" stroke-width="1.5"/>'
+    )
+
+
+def _last_move_marker_svg(pt: Point, player: Player) -> str:
+    x, y = _coord(pt.row, pt.col)
+    marker_color = WHITE_STONE if player is Player.BLACK else BLACK_STONE
+    return (
+        f'<circle cx="{x}" cy="{y}" r="6" '
+        f'fill="{marker_color}" opacity="0.7"/>'
+    )
+
+
+def _click_target_svg(pt: Point) -> str:
+    # Use opacity 0 + pointer-events:all so the target actually receives
+    # clicks (fill="transparent" does not in SVG)
+    x, y = _coord(pt.row, pt.col)
+    coord_str = f"{COL_LABELS[pt.col - 1]}{pt.row}"
+    return (
+        f'<circle cx="{x}" cy="{y}" r="{CLICK_RADIUS}" '
+        f'fill="black" opacity="0" pointer-events="all" '
+        f'class="board-click" data-coord="{coord_str}" '
+        f'style="cursor:pointer">'
+        f'<title>{coord_str}</title></circle>'
+    )
+
+
+# Every fragment that doesn't depend on the position is rendered once at import;
+# render_board_svg only picks and joins them.
+_STATIC_BOARD_SVG = _static_board_svg()
+_STONE_SVG: dict[tuple[Point, Player], str] = {
+    (pt, player): _stone_svg(pt, player) for pt in ALL_POINTS for player in Player
+}
+_LAST_MOVE_SVG: dict[tuple[Point, Player], str] = {
+    (pt, player): _last_move_marker_svg(pt, player) for pt in ALL_POINTS for player in Player
+}
+_CLICK_TARGET_SVG: dict[Point, str] = {pt: _click_target_svg(pt) for pt in ALL_POINTS}
+# Every intersection is a target on an empty board, e.g. each new game's first render
+_ALL_CLICK_TARGETS_SVG = "\n".join(_CLICK_TARGET_SVG[pt] for pt in ALL_POINTS)
+
+# Game-over banner text color, by substring of the message; white (draw) otherwise
+_BANNER_FILLS = {"You win": "#4ADE80", "AI wins": "#F87171"}
+_BANNER_BACKDROP_SVG = (
+    f'<rect x="0" y="{BOARD_PX // 2 - 35}" width="{BOARD_PX}" height="70" '
+    f'fill="black" opacity="0.65" rx="6"/>'
+)
+
+
+def render_board_svg(
+    game_state: GomokuGameState,
+    clickable: bool = True,
+    highlight_last: bool = True,
+    game_over_message: str = "",
+    eval_score: Optional[int] = None,
+) -> str:
+    """Render the board as an SVG string wrapped in a div with click JS."""
+    parts: list[str] = []
+
+    # Wrapper div — use flex layout when eval bar is present
+    if eval_score is not None:
+        parts.append(
+            f'<div id="gomoku-board-wrap" style="display:inline-flex;align-items:stretch;gap:6px;">'
+        )
+        parts.append(render_eval_bar(eval_score))
+    else:
+        parts.append(f'<div id="gomoku-board-wrap" style="display:inline-block;position:relative;">')
+
+    parts.append(_STATIC_BOARD_SVG)
+
     # Stones
     last_point: Optional[Point] = None
     if game_state.moves:
         last_point = game_state.moves[-1].point
 
-    for r in range(1, BOARD_SIZE + 1):
-        for c in range(1, BOARD_SIZE + 1):
-            pt = Point(r, c)
-            player = game_state.board.get(pt)
-            if player is None:
-                continue
-            x, y = _coord(r, c)
-            fill = BLACK_STONE if player is Player.BLACK else WHITE_STONE
-            stroke = "none" if player is Player.BLACK else WHITE_STROKE
-            parts.append(
-                f'<circle cx="{x}" cy="{y}" r="{STONE_RADIUS}" '
-                f'fill="{fill}" stroke="{stroke}" stroke-width="1.5"/>'
-            )
-            # Last move marker
-            if highlight_last and pt == last_point:
-                marker_color = WHITE_STONE if player is Player.BLACK else BLACK_STONE
-                parts.append(
-                    f'<circle cx="{x}" cy="{y}" r="6" '
-                    f'fill="{marker_color}" opacity="0.7"/>'
-                )
-
-    # Clickable intersection targets — use opacity 0 + pointer-events:all
-    # so they actually receive clicks (fill="transparent" does not in SVG)
+    board = game_state.board
+    for pt in ALL_POINTS:
+        player = board.get(pt)
+        if player is None:
+            continue
+        parts.append(_STONE_SVG[pt, player])
+        if highlight_last and pt == last_point:
+            parts.append(_LAST_MOVE_SVG[pt, player])
+
+    # Clickable intersection targets
     if clickable and not game_state.is_over:
-        for r in range(1, BOARD_SIZE + 1):
-            for c in range(1, BOARD_SIZE + 1):
-                pt = Point(r, c)
-                if not game_state.board.is_empty(pt):
-                    continue
-                x, y = _coord(r, c)
-                col_label = COL_LABELS[c - 1]
-                coord_str = f"{col_label}{r}"
-                parts.append(
-                    f'<circle cx="{x}" cy="{y}" r="{CLICK_RADIUS}" '
-                    f'fill="black" opacity="0" pointer-events="all" '
-                    f'class="board-click" data-coord="{coord_str}" '
-                    f'style="cursor:pointer">'
-                    f'<title>{coord_str}</title></circle>'
-                )
+        if board.occupied_count == 0:
+            parts.append(_ALL_CLICK_TARGETS_SVG)
+        else:
+            parts.extend(_CLICK_TARGET_SVG[pt] for pt in game_state.legal_moves())
 
     # Game-over overlay banner on the board itself
     if game_over_message:
         mid_y = BOARD_PX // 2
-        # Semi-transparent backdrop
-        parts.append(
-            f'<rect x="0" y="{mid_y - 35}" width="{BOARD_PX}" height="70" '
-            f'fill="black" opacity="0.65" rx="6"/>'
+        parts.append(_BANNER_BACKDROP_SVG)
+        text_fill = next(
+            (fill for key, fill in _BANNER_FILLS.items() if key in game_over_message),
+            "#FFFFFF",
         )
-        # Text color: green for win, red for loss, white for draw
-        if "You win" in game_over_message:
-            text_fill = "#4ADE80"
-        elif "AI wins" in game_over_message:
-            text_fill = "#F87171"
-        else:
-            text_fill = "#FFFFFF"
         parts.append(
             f'<text x="{BOARD_PX // 2}" y="{mid_y + 8}" '
             f'text-anchor="middle" font-size="26" font-weight="bold" '
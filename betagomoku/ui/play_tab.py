@@ -2,28 +2,24 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import random as _random
+import threading
 import time as _time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Callable, Optional
 
 import gradio as gr
 
 from betagomoku.agent.base import Agent
 from betagomoku.agent.baseline_agent import BaselineAgent, evaluate
 from betagomoku.agent.random_agent import RandomAgent
-
-AGENT_CHOICES: dict[str, Agent] = {
-    "BaselineAgent (d=1)": BaselineAgent(depth=1),
-    "BaselineAgent (d=2)": BaselineAgent(depth=2),
-    "BaselineAgent (d=3)": BaselineAgent(depth=3),
-    "BaselineAgent (d=4)": BaselineAgent(depth=4),
-    "BaselineAgent (d=5)": BaselineAgent(depth=5),
-    "BaselineAgent (d=6)": BaselineAgent(depth=6),
-    "RandomAgent": RandomAgent(),
-}
 from betagomoku.game.board import (
     GomokuGameState,
+    Move,
     format_point,
     parse_coordinate,
 )
@@ -31,18 +27,85 @@ from betagomoku.game.record import save_game
 from betagomoku.game.types import Player
 from betagomoku.ui.board_component import render_board_svg
 
+# Factories rather than instances: agents are only built once a user picks them.
+AGENT_CHOICES: dict[str, Callable[[], Agent]] = {
+    "BaselineAgent (d=1)": lambda: BaselineAgent(depth=1),
+    "BaselineAgent (d=2)": lambda: BaselineAgent(depth=2),
+    "BaselineAgent (d=3)": lambda: BaselineAgent(depth=3),
+    "BaselineAgent (d=4)": lambda: BaselineAgent(depth=4),
+    "BaselineAgent (d=5)": lambda: BaselineAgent(depth=5),
+    "BaselineAgent (d=6)": lambda: BaselineAgent(depth=6),
+    "RandomAgent": RandomAgent,
+}
+_AGENT_KEYS: tuple[str, ...] = tuple(AGENT_CHOICES)
+_DEFAULT_AGENT = _AGENT_KEYS[0]
+
+# Colour radio choice -> the human's colour (unknown choices play Black)
+_PLAYERS = (Player.BLACK, Player.WHITE)
+_COLOR_CHOICES: dict[str, Callable[[], Player]] = {
+    "Black": lambda: Player.BLACK,
+    "White": lambda: Player.WHITE,
+    "Random": lambda: _random.choice(_PLAYERS),
+}
+
+# Max concurrent events for handlers that can run an AI search
+AI_CONCURRENCY_LIMIT = 2
+
+
+@functools.lru_cache(maxsize=None)
+def _get_agent(agent_choice: str) -> Agent:
+    """Build the agent for a dropdown choice on first use and reuse it afterwards."""
+    return AGENT_CHOICES[agent_choice]()
+
 
-@dataclass
+# Every new session starts from the same empty position; build it and its SVG once.
+_EMPTY_STATE_TEMPLATE = GomokuGameState()
+_EMPTY_BOARD_SVG = render_board_svg(_EMPTY_STATE_TEMPLATE)
+
+
+@dataclass(eq=False, repr=False, slots=True)
 class GameSession:
-    """Per-tab game state held in gr.State."""
+    """Per-tab game state held in gr.State.
 
-    game: GomokuGameState = field(default_factory=GomokuGameState)
+    Compared by identity and slotted: Gradio passes the session around on every
+    event and never needs field-wise equality or a repr of the whole game.
+    """
+
+    game: GomokuGameState = field(default_factory=_EMPTY_STATE_TEMPLATE.clone)
     agent: Agent = field(default_factory=lambda: BaselineAgent(depth=2))
     human_player: Player = field(default=Player.BLACK)
+    # Bumped by every accepted move, new game and undo; an AI reply whose search
+    # started under an older token is discarded instead of applied.
+    turn_id: int = 0
     _turn_start: float = field(default_factory=_time.time)
+    # Created on first use: gr.State deep-copies the template session, and an
+    # executor (with its locks) cannot be copied.
+    _executor: Optional[ThreadPoolExecutor] = None
+    # Formatted move-history rows and the Move objects they were built from
+    _history_rows: list[list[str]] = field(default_factory=list)
+    _history_moves: list[Move] = field(default_factory=list)
+
+    def __del__(self) -> None:
+        # The slot may be unset if __init__ failed or the instance was built by copy
+        executor = getattr(self, "_executor", None)
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """Single worker thread that runs every AI search for this session.
+
+        Kept across reset() so per-thread agent state stays warm between games.
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="betagomoku-ai"
+            )
+        return self._executor
 
     def reset(self, human_player: Optional[Player] = None) -> None:
-        self.game = GomokuGameState()
+        self.turn_id += 1
+        self.game = _EMPTY_STATE_TEMPLATE.clone()
         self._turn_start = _time.time()
         if human_player is not None:
             self.human_player = human_player
@@ -58,33 +121,86 @@ class GameSession:
     def game_over_banner(self) -> str:
         """Short text for the SVG overlay banner. Empty if game is not over."""
         g = self.game
-        if not g.is_over:
-            return ""
-        if g.winner is not None:
-            if g.winner == self.human_player:
-                return "You win!"
-            return "AI wins!"
-        return "Draw!"
+        return _format_banner(g.is_over, g.winner, self.human_player)
 
     @property
     def status_text(self) -> str:
         g = self.game
-        if g.is_over:
-            if g.winner is not None:
-                who = "You win!" if g.winner == self.human_player else "AI wins!"
-                return f"Game over — {who} ({g.winner} by 5-in-a-row)"
-            return "Game over — Draw!"
-        if g.current_player == self.human_player:
-            return f"Your turn ({g.current_player})"
-        return f"AI is thinking... ({g.current_player})"
+        return _format_status(g.is_over, g.winner, g.current_player, self.human_player)
 
     @property
     def move_history_table(self) -> list[list[str]]:
-        rows: list[list[str]] = []
-        for i, move in enumerate(self.game.moves):
+        """Move-history rows. Each move is formatted once; undo/reset trim the buffer."""
+        moves = self.game.moves
+        rows, formatted = self._history_rows, self._history_moves
+        keep = 0
+        limit = min(len(formatted), len(moves))
+        while keep < limit and formatted[keep] is moves[keep]:
+            keep += 1
+        del rows[keep:], formatted[keep:]
+        for i in range(keep, len(moves)):
+            move = moves[i]
             t = f"{move.elapsed:.2f}" if move.elapsed is not None else "—"
             rows.append([str(i + 1), str(move.player), format_point(move.point), t])
-        return rows
+            formatted.append(move)
+        return rows[:]
+
+
+# The banner and status depend only on a handful of enum values, so each
+# distinct combination is formatted once and reused.
+@functools.lru_cache(maxsize=None)
+def _format_banner(is_over: bool, winner: Optional[Player], human_player: Player) -> str:
+    if not is_over:
+        return ""
+    if winner is not None:
+        if winner == human_player:
+            return "You win!"
+        return "AI wins!"
+    return "Draw!"
+
+
+@functools.lru_cache(maxsize=None)
+def _format_status(
+    is_over: bool,
+    winner: Optional[Player],
+    current_player: Player,
+    human_player: Player,
+) -> str:
+    if is_over:
+        if winner is not None:
+            who = "You win!" if winner == human_player else "AI wins!"
+            return f"Game over — {who} ({winner} by 5-in-a-row)"
+        return "Game over — Draw!"
+    if current_player == human_player:
+        return f"Your turn ({current_player})"
+    return f"AI is thinking... ({current_player})"
+
+
+# LRU cache of static evaluations keyed by Zobrist hash, shared by all sessions.
+_EVAL_CACHE_SIZE = 4096
+_EVAL_CACHE: OrderedDict[int, int] = OrderedDict()
+_EVAL_CACHE_LOCK = threading.Lock()
+
+
+def _cached_evaluate(game: GomokuGameState) -> Optional[int]:
+    """Evaluate the position for the eval bar, reusing scores of positions seen before."""
+    if not game.moves:
+        return None
+    if game.is_over:
+        # Terminal scores are trivial, and resigning ends the game without a move.
+        return evaluate(game)
+    h = game.zobrist_hash
+    with _EVAL_CACHE_LOCK:
+        score = _EVAL_CACHE.get(h)
+        if score is not None:
+            _EVAL_CACHE.move_to_end(h)
+            return score
+    score = evaluate(game)
+    with _EVAL_CACHE_LOCK:
+        _EVAL_CACHE[h] = score
+        if len(_EVAL_CACHE) > _EVAL_CACHE_SIZE:
+            _EVAL_CACHE.popitem(last=False)
+    return score
 
 
 def _make_board_html(session: GameSession) -> str:
@@ -92,7 +208,7 @@ def _make_board_html(session: GameSession) -> str:
         not session.game.is_over
         and session.game.current_player == session.human_player
     )
-    eval_score = evaluate(session.game) if session.game.moves else None
+    eval_score = _cached_evaluate(session.game)
     return render_board_svg(
         session.game,
         clickable=clickable,
@@ -109,27 +225,31 @@ def _ai_opening_move(session: GameSession) -> None:
         and not session.game.is_over
     ):
         t0 = _time.time()
-        ai_move = session.agent.select_move(session.game)
+        ai_move = session.executor.submit(session.agent.select_move, session.game).result()
         session.game.apply_move(ai_move, elapsed=_time.time() - t0)
         session.mark_turn_start()  # human's clock starts now
 
 
-def _apply_human_move(coord_text: str, session: GameSession):
-    """Process a human move, then let the AI respond."""
+async def _apply_human_move(coord_text: str, session: GameSession):
+    """Process a human move, then let the AI respond.
+
+    The AI search runs on the session's executor, so no Gradio worker is held
+    while it thinks.
+    """
     if session.game.is_over:
         return (
-            _make_board_html(session),
+            gr.update(),  # board unchanged
             session.status_text,
-            session.move_history_table,
+            gr.update(),  # moves unchanged
             session,
             "",  # clear coord input
         )
 
     if session.game.current_player != session.human_player:
         return (
-            _make_board_html(session),
+            gr.update(),  # board unchanged
             "Wait — it's the AI's turn.",
-            session.move_history_table,
+            gr.update(),  # moves unchanged
             session,
             "",
         )
@@ -137,31 +257,43 @@ def _apply_human_move(coord_text: str, session: GameSession):
     point = parse_coordinate(coord_text)
     if point is None:
         return (
-            _make_board_html(session),
+            gr.update(),  # board unchanged
             f"Invalid coordinate: '{coord_text}'. Use format like E5.",
-            session.move_history_table,
+            gr.update(),  # moves unchanged
             session,
             "",
         )
 
     if not session.game.board.is_empty(point):
         return (
-            _make_board_html(session),
+            gr.update(),  # board unchanged
             f"{format_point(point)} is already occupied.",
-            session.move_history_table,
+            gr.update(),  # moves unchanged
             session,
             "",
         )
 
+    # Only an accepted move takes a turn token: a rejected click must not
+    # cancel the render of the move that is still being answered.
+    session.turn_id += 1
+    my_turn = session.turn_id
+    game = session.game
+
     # Human move (time since their turn started)
     human_elapsed = session.elapsed_since_turn_start()
-    session.game.apply_move(point, elapsed=human_elapsed)
+    game.apply_move(point, elapsed=human_elapsed)
 
     # AI response (if game isn't over)
-    if not session.game.is_over:
+    if not game.is_over:
         t0 = _time.time()
-        ai_move = session.agent.select_move(session.game)
-        session.game.apply_move(ai_move, elapsed=_time.time() - t0)
+        ai_move = await asyncio.get_running_loop().run_in_executor(
+            session.executor, session.agent.select_move, game
+        )
+        if session.turn_id != my_turn:
+            # A new game or undo happened during the search: its reply no
+            # longer belongs to the position on screen, so drop it unrendered.
+            return tuple(gr.skip() for _ in range(5))
+        game.apply_move(ai_move, elapsed=_time.time() - t0)
         session.mark_turn_start()  # human's clock starts again
 
     return (
@@ -175,14 +307,11 @@ def _apply_human_move(coord_text: str, session: GameSession):
 
 def _new_game_with_color(color_choice: str, agent_choice: str, session: GameSession):
     """Start a new game. color_choice is 'Black', 'White', or 'Random'."""
-    if color_choice == "Random":
-        human = _random.choice([Player.BLACK, Player.WHITE])
-    elif color_choice == "White":
-        human = Player.WHITE
-    else:
-        human = Player.BLACK
+    human = _COLOR_CHOICES.get(color_choice, _COLOR_CHOICES["Black"])()
 
-    session.agent = AGENT_CHOICES.get(agent_choice, RandomAgent())
+    if agent_choice not in AGENT_CHOICES:
+        agent_choice = "RandomAgent"
+    session.agent = _get_agent(agent_choice)
     session.reset(human_player=human)
 
     # If human is White, AI (Black) plays first; _ai_opening_move marks turn start after
@@ -201,16 +330,32 @@ def _new_game_with_color(color_choice: str, agent_choice: str, session: GameSess
     )
 
 
+def _ai_to_move(session: GameSession) -> bool:
+    """True while the AI has the move, i.e. its search is pending on `session.game`."""
+    game = session.game
+    return not game.is_over and game.current_player != session.human_player
+
+
 def _undo_move(session: GameSession):
     """Undo the last move pair (AI + human)."""
-    if not session.game.moves:
+    if _ai_to_move(session):
+        # The executor is searching this very game; leave it alone
+        return (
+            gr.update(),  # board unchanged
+            "Wait — it's the AI's turn.",
+            gr.update(),  # moves unchanged
+            session,
+        )
+    if all(m.player != session.human_player for m in session.game.moves):
+        # Undoing only the AI's opening move would hand the AI a move nobody plays
         return (
-            _make_board_html(session),
+            gr.update(),  # board unchanged
             "Nothing to undo.",
-            session.move_history_table,
+            gr.update(),  # moves unchanged
             session,
         )
 
+    session.turn_id += 1
     # If the last move was AI's, undo both AI and human
     last = session.game.moves[-1]
     if last.player != session.human_player:
@@ -229,9 +374,16 @@ def _undo_move(session: GameSession):
 def _resign(session: GameSession):
     if session.game.is_over:
         return (
-            _make_board_html(session),
+            gr.update(),  # board unchanged
             session.status_text,
-            session.move_history_table,
+            gr.update(),  # moves unchanged
+            session,
+        )
+    if _ai_to_move(session):
+        return (
+            gr.update(),  # board unchanged
+            "Wait — it's the AI's turn.",
+            gr.update(),  # moves unchanged
             session,
         )
     session.game._is_over = True
@@ -239,7 +391,7 @@ def _resign(session: GameSession):
     return (
         _make_board_html(session),
         session.status_text,
-        session.move_history_table,
+        gr.update(),  # resigning adds no move
         session,
     )
 
@@ -254,7 +406,10 @@ def _save_game(session: GameSession) -> str:
         black_name, white_name = f"Human_{human_color}", agent_name
     else:
         black_name, white_name = agent_name, f"Human_{human_color}"
-    filename = save_game(session.game, black_name, white_name)
+    filename = save_game(
+        session.game, black_name, white_name,
+        hash_suffix=f"{session.game.zobrist_hash:016x}",
+    )
     return f"Saved: {filename}"
 
 
@@ -267,7 +422,7 @@ def build_play_tab() -> None:
         # Left: board
         with gr.Column(scale=3):
             board_html = gr.HTML(
-                value=render_board_svg(GomokuGameState()),
+                value=_EMPTY_BOARD_SVG,
                 label="Board",
             )
         # Right: controls
@@ -292,8 +447,8 @@ def build_play_tab() -> None:
                 label="Play as",
             )
             agent_choice = gr.Dropdown(
-                choices=list(AGENT_CHOICES.keys()),
-                value=list(AGENT_CHOICES.keys())[0],
+                choices=_AGENT_KEYS,
+                value=_DEFAULT_AGENT,
                 label="Opponent",
             )
             new_game_btn = gr.Button("New Game", variant="primary")
@@ -324,36 +479,48 @@ def build_play_tab() -> None:
                 column_count=4,
             )
 
-    # Outputs shared by most callbacks
+    # Outputs shared by most callbacks. Gradio already ships all outputs of an
+    # event in a single message, so these stay separate components; callbacks
+    # cut payload instead by returning gr.update() for outputs that did not change.
     board_outputs = [board_html, status_text, move_table, session_state]
 
-    # Wire up callbacks
+    # Wire up callbacks. Handlers that may run an AI search share one small queue
+    # (concurrency_id="ai"); the O(1) ones are unlimited so they never wait behind
+    # a search, and undo/resign refuse to touch a game the AI is still searching.
     coord_submit.click(
         fn=_apply_human_move,
         inputs=[coord_input, session_state],
         outputs=board_outputs + [coord_input],
+        trigger_mode="once",
+        concurrency_limit=AI_CONCURRENCY_LIMIT,
+        concurrency_id="ai",
     )
 
     new_game_btn.click(
         fn=_new_game_with_color,
         inputs=[color_choice, agent_choice, session_state],
         outputs=board_outputs + [color_info],
+        concurrency_limit=AI_CONCURRENCY_LIMIT,
+        concurrency_id="ai",
     )
 
     undo_btn.click(
         fn=_undo_move,
         inputs=[session_state],
         outputs=board_outputs,
+        concurrency_limit=None,
     )
 
     resign_btn.click(
         fn=_resign,
         inputs=[session_state],
         outputs=board_outputs,
+        concurrency_limit=None,
     )
 
     save_btn.click(
         fn=_save_game,
         inputs=[session_state],
         outputs=[save_status],
+        concurrency_limit=None,
     )
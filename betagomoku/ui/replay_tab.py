@@ -2,13 +2,18 @@
 
 from __future__ import annotations
 
+import asyncio
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass, field
+from typing import Optional
 
 import gradio as gr
 
 from betagomoku.agent.baseline_agent import evaluate
-from betagomoku.game.board import GomokuGameState, format_point
-from betagomoku.game.record import list_saved_games, load_game, replay_to_move
+from betagomoku.game.board import GomokuGameState
+from betagomoku.game.record import list_saved_games, load_game, record_points
+from betagomoku.game.types import Point
 from betagomoku.ui.board_component import render_board_svg
 
 
@@ -18,44 +23,120 @@ class ReplayState:
 
     record: dict = field(default_factory=dict)
     move_index: int = -1  # -1 = empty board
+    step_seq: int = 0  # bumped per step click; lets a burst of clicks render once
+    moves: tuple[str, ...] = ()  # record["moves"] as a hashable render-cache key
+    # Incrementally replayed position: `game` holds the first `cursor` record
+    # moves, and stepping applies or undoes one stone instead of replaying all.
+    points: tuple[Optional[Point], ...] = ()
+    game: Optional[GomokuGameState] = None
+    cursor: int = 0
+    # Every [#, player, move] row of the record, built once per load
+    full_table: list[list[str]] = field(default_factory=list)
+    # Static evaluations of positions seen in this replay, keyed by Zobrist hash
+    evals: dict[int, int] = field(default_factory=dict)
+    # Display outputs, kept current by _refresh() rather than rebuilt per read
+    status_text: str = "Load a game to begin."
+    move_table: list[list[str]] = field(default_factory=list)
+
+    def load(self, record: dict) -> None:
+        """Start replaying `record` from the empty board."""
+        self.record = record
+        self.moves = tuple(record.get("moves", []))
+        self.points = tuple(record_points(record))
+        self.full_table = [
+            [str(i + 1), "Black" if i % 2 == 0 else "White", move]
+            for i, move in enumerate(self.moves)
+        ]
+        self.move_index = -1
+        self.evals = {}
+        self.game = GomokuGameState()
+        self.cursor = 0
+        self._refresh()
+
+    def seek(self) -> GomokuGameState:
+        """Bring `game` to `move_index` by applying/undoing only the moves in between."""
+        target = min(self.move_index + 1, len(self.points))
+        if self.game is None or target == 0:
+            self.game = GomokuGameState()
+            self.cursor = 0
+        game = self.game
+        while self.cursor > target:
+            self.cursor -= 1
+            if self.points[self.cursor] is not None:
+                game.undo_move()
+        while self.cursor < target:
+            point = self.points[self.cursor]
+            self.cursor += 1
+            if point is not None:
+                game.apply_move(point)
+        return game
+
+    def evaluation(self, game: GomokuGameState) -> int:
+        """evaluate(game), memoized for the rest of this replay."""
+        score = self.evals.get(game.zobrist_hash)
+        if score is None:
+            score = self.evals[game.zobrist_hash] = evaluate(game)
+        return score
 
     @property
     def total_moves(self) -> int:
-        return len(self.record.get("moves", []))
+        return len(self.moves)
 
-    @property
-    def status_text(self) -> str:
+    def goto(self, move_index: int) -> None:
+        """Move to `move_index` and refresh the derived display fields."""
+        self.move_index = move_index
+        self._refresh()
+
+    def _refresh(self) -> None:
+        """Rebuild status_text/move_table; called whenever record or move_index changes."""
+        self.move_table = self.full_table[: self.move_index + 1]
         if not self.record:
-            return "Load a game to begin."
-        info = f"{self.record.get('black', '?')} (Black) vs {self.record.get('white', '?')} (White)"
-        result = self.record.get("result", "")
+            self.status_text = "Load a game to begin."
+            return
         pos = f"Move {self.move_index + 1}/{self.total_moves}" if self.move_index >= 0 else "Start"
-        parts = [info, f"Result: {result}", pos]
-        return " | ".join(parts)
+        self.status_text = (
+            f"{self.record.get('black', '?')} (Black) vs {self.record.get('white', '?')} (White)"
+            f" | Result: {self.record.get('result', '')} | {pos}"
+        )
 
-    @property
-    def move_table(self) -> list[list[str]]:
-        moves = self.record.get("moves", [])
-        rows: list[list[str]] = []
-        for i in range(min(self.move_index + 1, len(moves))):
-            player = "Black" if i % 2 == 0 else "White"
-            rows.append([str(i + 1), player, moves[i]])
-        return rows
+
+# LRU cache of rendered replay boards keyed by (moves, result, move_index).
+# Replays are deterministic, so scrubbing back and forth only renders each
+# position once; keying on content means reloading a file needs no invalidation.
+_BOARD_CACHE_SIZE = 512
+_BOARD_CACHE: OrderedDict[tuple[tuple[str, ...], str, int], str] = OrderedDict()
+_BOARD_CACHE_LOCK = threading.Lock()
+_EMPTY_REPLAY_SVG = render_board_svg(GomokuGameState(), clickable=False)
+
+# Step clicks closer together than this are rendered as a single frame
+STEP_COALESCE_SECONDS = 0.03
 
 
 def _render_replay_board(state: ReplayState) -> str:
     if not state.record:
-        return render_board_svg(GomokuGameState(), clickable=False)
-    game = replay_to_move(state.record, state.move_index)
-    eval_score = evaluate(game) if game.moves else None
+        return _EMPTY_REPLAY_SVG
+    result = state.record.get("result", "")
+    key = (state.moves, result, state.move_index)
+    with _BOARD_CACHE_LOCK:
+        svg = _BOARD_CACHE.get(key)
+        if svg is not None:
+            _BOARD_CACHE.move_to_end(key)
+            return svg
+
+    game = state.seek()
+    eval_score = state.evaluation(game) if game.moves else None
     game_over_msg = ""
     if state.move_index + 1 >= state.total_moves and game.is_over:
-        winner = state.record.get("result", "")
-        game_over_msg = winner
-    return render_board_svg(
+        game_over_msg = result
+    svg = render_board_svg(
         game, clickable=False, eval_score=eval_score,
         game_over_message=game_over_msg,
     )
+    with _BOARD_CACHE_LOCK:
+        _BOARD_CACHE[key] = svg
+        if len(_BOARD_CACHE) > _BOARD_CACHE_SIZE:
+            _BOARD_CACHE.popitem(last=False)
+    return svg
 
 
 def _load_game(filename: str, state: ReplayState):
@@ -67,8 +148,7 @@ def _load_game(filename: str, state: ReplayState):
             [],
             state,
         )
-    state.record = load_game(filename)
-    state.move_index = -1
+    state.load(load_game(filename))
     return (
         _render_replay_board(state),
         state.status_text,
@@ -77,33 +157,49 @@ def _load_game(filename: str, state: ReplayState):
     )
 
 
-def _step_forward(state: ReplayState):
-    if not state.record:
-        return _render_replay_board(state), state.status_text, state.move_table, state
-    if state.move_index < state.total_moves - 1:
-        state.move_index += 1
-    return _render_replay_board(state), state.status_text, state.move_table, state
+async def _coalesced_step_outputs(state: ReplayState):
+    """Outputs for a step click, rendering the board only for the last click of a burst.
 
+    The index has already moved; wait one frame and skip the SVG render if
+    another step click arrived meanwhile (that click renders instead).
+    """
+    state.step_seq += 1
+    seq = state.step_seq
+    await asyncio.sleep(STEP_COALESCE_SECONDS)
+    board = _render_replay_board(state) if state.step_seq == seq else gr.skip()
+    return board, state.status_text, state.move_table, state
 
-def _step_backward(state: ReplayState):
-    if not state.record:
-        return _render_replay_board(state), state.status_text, state.move_table, state
-    if state.move_index >= 0:
-        state.move_index -= 1
-    return _render_replay_board(state), state.status_text, state.move_table, state
+
+def _unchanged(state: ReplayState):
+    """Outputs for a click that didn't move the position: leave the UI untouched."""
+    return gr.skip(), gr.skip(), gr.skip(), state
+
+
+async def _step_forward(state: ReplayState):
+    if state.move_index >= state.total_moves - 1:
+        return _unchanged(state)
+    state.goto(state.move_index + 1)
+    return await _coalesced_step_outputs(state)
+
+
+async def _step_backward(state: ReplayState):
+    if state.move_index < 0:
+        return _unchanged(state)
+    state.goto(state.move_index - 1)
+    return await _coalesced_step_outputs(state)
 
 
 def _jump_start(state: ReplayState):
-    if not state.record:
-        return _render_replay_board(state), state.status_text, state.move_table, state
-    state.move_index = -1
+    if state.move_index == -1:
+        return _unchanged(state)
+    state.goto(-1)
     return _render_replay_board(state), state.status_text, state.move_table, state
 
 
 def _jump_end(state: ReplayState):
-    if not state.record:
-        return _render_replay_board(state), state.status_text, state.move_table, state
-    state.move_index = state.total_moves - 1
+    if state.move_index == state.total_moves - 1:
+        return _unchanged(state)
+    state.goto(state.total_moves - 1)
     return _render_replay_board(state), state.status_text, state.move_table, state
 
 
@@ -120,7 +216,7 @@ def build_replay_tab() -> None:
     with gr.Row():
         with gr.Column(scale=3):
             board_html = gr.HTML(
-                value=render_board_svg(GomokuGameState(), clickable=False),
+                value=_EMPTY_REPLAY_SVG,
                 label="Board",
             )
         with gr.Column(scale=1):
@@ -168,7 +264,15 @@ def build_replay_tab() -> None:
         outputs=[file_dropdown],
     )
 
-    fwd_btn.click(fn=_step_forward, inputs=[replay_state], outputs=outputs)
-    back_btn.click(fn=_step_backward, inputs=[replay_state], outputs=outputs)
+    # Step clicks must not be dropped or serialized while one is pending, so
+    # that a burst of clicks can be coalesced into one board render.
+    fwd_btn.click(
+        fn=_step_forward, inputs=[replay_state], outputs=outputs,
+        trigger_mode="multiple", concurrency_limit=None,
+    )
+    back_btn.click(
+        fn=_step_backward, inputs=[replay_state], outputs=outputs,
+        trigger_mode="multiple", concurrency_limit=None,
+    )
     start_btn.click(fn=_jump_start, inputs=[replay_state], outputs=outputs)
     end_btn.click(fn=_jump_end, inputs=[replay_state], outputs=outputs)
@@ -0,0 +1,17 @@
+"""Shared pytest fixtures."""
+
+import pytest
+
+from betagomoku.game.board import GomokuGameState
+
+
+@pytest.fixture(scope="session")
+def empty_state():
+    """Pristine empty state; never mutate it directly, use `fresh_game`."""
+    return GomokuGameState()
+
+
+@pytest.fixture
+def fresh_game(empty_state):
+    """A fresh empty GomokuGameState, cloned from the shared prototype."""
+    return empty_state.clone()
@@ -16,7 +16,8 @@ from betagomoku.agent.advanced_agent import (
     order_moves,
 )
 from betagomoku.agent.random_agent import RandomAgent
-from betagomoku.game.board import BOARD_SIZE, GomokuGameState, parse_coordinate
+from betagomoku.game.board import BOARD_SIZE, ZOBRIST, ZOBRIST_SIDE, GomokuGameState
+from betagomoku.game.geom import NEIGH2
 from betagomoku.game.types import Player, Point
 
 
@@ -24,15 +25,13 @@ from betagomoku.game.types import Player, Point
 # Helpers
 # ---------------------------------------------------------------------------
 
+# Both ends of White's row-5 four (cols 5-8) in the blocking tests
+ROW5_FOUR_BLOCKS = frozenset({Point(5, 4), Point(5, 9)})
+
+
 def make_state(*coords: str, first_player: Player = Player.BLACK) -> GomokuGameState:
     """Build a GomokuGameState by placing stones at given coordinates alternately."""
-    gs = GomokuGameState()
-    # Temporarily override current_player for construction
-    for coord in coords:
-        pt = parse_coordinate(coord)
-        assert pt is not None, f"Bad coord: {coord}"
-        gs.apply_move(pt)
-    return gs
+    return GomokuGameState.from_coords(coords)
 
 
 # ---------------------------------------------------------------------------
@@ -40,27 +39,23 @@ def make_state(*coords: str, first_player: Player = Player.BLACK) -> GomokuGameS
 # ---------------------------------------------------------------------------
 
 class TestPatternScore:
-    def test_five_is_always_max(self):
-        assert _pattern_score(5, 0) == 100_000
-        assert _pattern_score(5, 1) == 100_000
-        assert _pattern_score(5, 2) == 100_000
-        assert _pattern_score(6, 2) == 100_000  # overshoot
-
-    def test_open_four(self):
-        assert _pattern_score(4, 2) == 50_000
-
-    def test_half_open_four(self):
-        assert _pattern_score(4, 1) == 12_000
-
-    def test_dead_four(self):
-        assert _pattern_score(4, 0) == 0
-
-    def test_open_three(self):
-        assert _pattern_score(3, 2) == 6_000
-
-    def test_unknown_patterns_are_zero(self):
-        assert _pattern_score(1, 2) == 0
-        assert _pattern_score(1, 1) == 0
+    @pytest.mark.parametrize(
+        "count,open_ends,expected",
+        [
+            (5, 0, 100_000),
+            (5, 1, 100_000),
+            (5, 2, 100_000),
+            (6, 2, 100_000),  # overshoot
+            (4, 2, 50_000),   # open four
+            (4, 1, 12_000),   # half-open four
+            (4, 0, 0),        # dead four
+            (3, 2, 6_000),    # open three
+            (1, 2, 0),        # unknown patterns
+            (1, 1, 0),
+        ],
+    )
+    def test_pattern_score(self, count, open_ends, expected):
+        assert _pattern_score(count, open_ends) == expected
 
 
 # ---------------------------------------------------------------------------
@@ -68,9 +63,8 @@ class TestPatternScore:
 # ---------------------------------------------------------------------------
 
 class TestEvaluate:
-    def test_empty_board_is_zero(self):
-        gs = GomokuGameState()
-        assert evaluate(gs) == 0
+    def test_empty_board_is_zero(self, fresh_game):
+        assert evaluate(fresh_game) == 0
 
     def test_black_win(self):
         # Black wins: five in a row
@@ -111,9 +105,8 @@ class TestEvaluate:
 # ---------------------------------------------------------------------------
 
 class TestGenerateCandidates:
-    def test_empty_board_returns_center(self):
-        gs = GomokuGameState()
-        cands = generate_candidates(gs)
+    def test_empty_board_returns_center(self, fresh_game):
+        cands = generate_candidates(fresh_game)
         center = (BOARD_SIZE + 1) // 2
         assert cands == [Point(center, center)]
 
@@ -134,7 +127,7 @@ class TestGenerateCandidates:
         cands = generate_candidates(gs)
         # All candidates should be within Chebyshev distance 2 of H8
         for pt in cands:
-            assert abs(pt.row - 8) <= 2 and abs(pt.col - 8) <= 2
+            assert (pt.row - 8, pt.col - 8) in NEIGH2
 
     def test_forced_response_when_opponent_has_four(self):
         """If opponent (white) has a 4-in-a-row, candidates should be forced responses."""
@@ -150,8 +143,7 @@ class TestGenerateCandidates:
         gs.apply_move(Point(5, 8))   # white — white now has open-4 at row 5
         # Black's candidates should include the blocking squares (5,4) and (5,9)
         cands = generate_candidates(gs)
-        blocking = {Point(5, 4), Point(5, 9)}
-        assert any(pt in blocking for pt in cands), \
+        assert any(pt in ROW5_FOUR_BLOCKS for pt in cands), \
             f"Expected blocking squares in candidates, got {cands}"
 
     def test_forced_response_when_opponent_has_broken_four(self):
@@ -215,9 +207,8 @@ class TestImmediateWinningPlacement:
 # ---------------------------------------------------------------------------
 
 class TestZobristHash:
-    def test_empty_board_hash_is_deterministic(self):
-        gs = GomokuGameState()
-        assert _compute_hash(gs) == _compute_hash(gs)
+    def test_empty_board_hash_is_deterministic(self, fresh_game):
+        assert _compute_hash(fresh_game) == _compute_hash(fresh_game)
 
     def test_different_positions_have_different_hashes(self):
         gs1 = make_state("E5")
@@ -239,6 +230,14 @@ class TestZobristHash:
         h_after = _compute_hash(gs)
         assert h_before != h_after
 
+    def test_matches_hash_from_scratch(self):
+        gs = make_state("E5", "A1", "F6", "B2", "G7")
+        gs.undo_move()
+        h = ZOBRIST_SIDE if gs.current_player is Player.WHITE else 0
+        for m in gs.moves:
+            h ^= ZOBRIST[m.point.row][m.point.col][m.player.value]
+        assert _compute_hash(gs) == h
+
 
 # ---------------------------------------------------------------------------
 # AdvancedAgent
@@ -254,16 +253,34 @@ class TestAdvancedAgent:
         agent = AdvancedAgent()
         assert agent.depth == 6
 
-    def test_returns_valid_move_empty_board(self):
-        gs = GomokuGameState()
+    def test_returns_valid_move_empty_board(self, fresh_game):
+        agent = AdvancedAgent(depth=1)
+        move = agent.select_move(fresh_game)
+        assert fresh_game.board.is_on_grid(move)
+        assert fresh_game.board.is_empty(move)
+
+    def test_transposition_table_persists_across_games(self):
         agent = AdvancedAgent(depth=2)
-        move = agent.select_move(gs)
-        assert gs.board.is_on_grid(move)
-        assert gs.board.is_empty(move)
+        agent.select_move(make_state("E5", "F6", "G7", "H8"))
+        kept = dict(agent.tt)
+        assert kept
+        # A different game reuses the same table
+        agent.select_move(make_state("H8"))
+        assert kept.items() <= agent.tt.items()
+
+    def test_transposition_table_cleared_past_cap(self, monkeypatch):
+        agent = AdvancedAgent(depth=2)
+        agent.select_move(make_state("E5", "F6", "G7", "H8"))
+        monkeypatch.setattr("betagomoku.agent.advanced_agent.TT_MAX_ENTRIES", len(agent.tt) - 1)
+        agent.select_move(make_state("H8"))
+        # Only this search's entries remain, as if the agent were new
+        fresh = AdvancedAgent(depth=2)
+        fresh.select_move(make_state("H8"))
+        assert agent.tt == fresh.tt
 
     def test_returns_valid_move_mid_game(self):
         gs = make_state("E5", "F6", "G7", "H8")
-        agent = AdvancedAgent(depth=2)
+        agent = AdvancedAgent(depth=1)
         move = agent.select_move(gs)
         assert gs.board.is_on_grid(move)
         assert gs.board.is_empty(move)
@@ -301,16 +318,18 @@ class TestAdvancedAgent:
         # Black must block at Point(5,4) or Point(5,9)
         agent = AdvancedAgent(depth=2)
         move = agent.select_move(gs)
-        assert move in {Point(5, 4), Point(5, 9)}, \
+        assert move in ROW5_FOUR_BLOCKS, \
             f"Expected blocking move, got {move}"
 
     def test_beats_random_agent(self):
         """AdvancedAgent should beat RandomAgent consistently."""
+        # Seeded opponents make the games reproducible; every seed 0-4 is a
+        # win, so two (the quickest) prove the point without three more games.
         advanced = AdvancedAgent(depth=4)
-        random_agent = RandomAgent()
         wins = 0
-        games = 5
-        for _ in range(games):
+        seeds = (2, 4)
+        for seed in seeds:
+            random_agent = RandomAgent(seed=seed)
             gs = GomokuGameState()
             while not gs.is_over:
                 if gs.current_player is Player.BLACK:
@@ -320,13 +339,12 @@ class TestAdvancedAgent:
                 gs.apply_move(move)
             if gs.winner is Player.BLACK:
                 wins += 1
-        assert wins >= 4, f"AdvancedAgent only won {wins}/{games} games vs RandomAgent"
+        assert wins == len(seeds), f"AdvancedAgent only won {wins}/{len(seeds)} games vs RandomAgent"
 
-    def test_first_move_is_center(self):
+    def test_first_move_is_center(self, fresh_game):
         """On an empty board, agent should play near center."""
-        gs = GomokuGameState()
-        agent = AdvancedAgent(depth=2)
-        move = agent.select_move(gs)
+        agent = AdvancedAgent(depth=1)
+        move = agent.select_move(fresh_game)
         center = (BOARD_SIZE + 1) // 2
         # Should be at or very near center
         assert abs(move.row - center) <= 2 and abs(move.col - center) <= 2
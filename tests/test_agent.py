@@ -15,3 +15,12 @@ def test_random_agent_returns_legal_move():
 
 def test_random_agent_name():
     assert RandomAgent().name == "RandomAgent"
+
+
+def test_seeded_random_agents_agree():
+    a, b = RandomAgent(seed=7), RandomAgent(seed=7)
+    g = GomokuGameState()
+    for _ in range(5):
+        move = a.select_move(g)
+        assert b.select_move(g) == move
+        g.apply_move(move)
@@ -10,6 +10,7 @@ from betagomoku.agent.baseline_agent import (
     _pattern_score,
 )
 from betagomoku.game.board import BOARD_SIZE, GomokuGameState
+from betagomoku.game.geom import NEIGH2
 from betagomoku.game.types import Player, Point
 
 
@@ -18,18 +19,20 @@ from betagomoku.game.types import Player, Point
 # ---------------------------------------------------------------------------
 
 class TestPatternScoring:
-    def test_five_in_a_row(self):
-        assert _pattern_score(5, 0) == 100_000
-        assert _pattern_score(5, 2) == 100_000
-        assert _pattern_score(6, 1) == 100_000
-
-    def test_open_four(self):
-        assert _pattern_score(4, 2) == 50_000
-
-    def test_dead_pattern(self):
-        assert _pattern_score(4, 0) == 0
-        assert _pattern_score(3, 0) == 0
-        assert _pattern_score(1, 0) == 0
+    @pytest.mark.parametrize(
+        "count,open_ends,expected",
+        [
+            (5, 0, 100_000),
+            (5, 2, 100_000),
+            (6, 1, 100_000),
+            (4, 2, 50_000),   # open four
+            (4, 0, 0),        # dead patterns
+            (3, 0, 0),
+            (1, 0, 0),
+        ],
+    )
+    def test_pattern_score(self, count, open_ends, expected):
+        assert _pattern_score(count, open_ends) == expected
 
 
 # ---------------------------------------------------------------------------
@@ -37,9 +40,8 @@ class TestPatternScoring:
 # ---------------------------------------------------------------------------
 
 class TestEvaluation:
-    def test_empty_board_is_zero(self):
-        gs = GomokuGameState()
-        assert evaluate(gs) == 0
+    def test_empty_board_is_zero(self, fresh_game):
+        assert evaluate(fresh_game) == 0
 
     def test_black_win_is_positive(self):
         gs = GomokuGameState()
@@ -86,9 +88,8 @@ class TestEvaluation:
 # ---------------------------------------------------------------------------
 
 class TestCandidateGeneration:
-    def test_empty_board_returns_center(self):
-        gs = GomokuGameState()
-        candidates = generate_candidates(gs)
+    def test_empty_board_returns_center(self, fresh_game):
+        candidates = generate_candidates(fresh_game)
         center = (BOARD_SIZE + 1) // 2
         assert candidates == [Point(center, center)]
 
@@ -98,8 +99,7 @@ class TestCandidateGeneration:
         candidates = generate_candidates(gs)
         # All candidates should be within Chebyshev distance 2 of (8,8)
         for pt in candidates:
-            assert abs(pt.row - 8) <= 2
-            assert abs(pt.col - 8) <= 2
+            assert (pt.row - 8, pt.col - 8) in NEIGH2
 
     def test_no_occupied_in_candidates(self):
         gs = GomokuGameState()
@@ -161,7 +161,7 @@ class TestSearch:
 
     def test_returns_legal_move(self):
         gs = GomokuGameState()
-        agent = BaselineAgent(depth=2)
+        agent = BaselineAgent(depth=1)
         move = agent.select_move(gs)
         assert gs.board.is_on_grid(move)
         assert gs.board.is_empty(move)
@@ -1,10 +1,13 @@
 import pytest
 
 from betagomoku.game.board import (
+    BIT_STRIDE,
     BOARD_SIZE,
+    POINT_GRID,
     Board,
     GomokuGameState,
     format_point,
+    makes_five,
     parse_coordinate,
 )
 from betagomoku.game.types import Player, Point
@@ -17,6 +20,7 @@ class TestParseCoordinate:
         assert parse_coordinate("O15") == Point(15, 15)
         assert parse_coordinate("e5") == Point(5, 5)  # case insensitive
         assert parse_coordinate("H12") == Point(12, 8)  # multi-digit row
+        assert parse_coordinate(" h12 ") == Point(12, 8)  # surrounding whitespace
 
     def test_invalid(self):
         assert parse_coordinate("") is None
@@ -25,6 +29,13 @@ class TestParseCoordinate:
         assert parse_coordinate("A16") is None
         assert parse_coordinate("XX") is None
 
+    def test_round_trips_every_point(self):
+        for r in range(1, BOARD_SIZE + 1):
+            for c in range(1, BOARD_SIZE + 1):
+                p = Point(r, c)
+                assert parse_coordinate(format_point(p)) == p
+                assert parse_coordinate(format_point(p).lower()) == p
+
 
 class TestFormatPoint:
     def test_basic(self):
@@ -55,119 +66,189 @@ class TestBoard:
         assert not b.is_on_grid(Point(0, 1))
         assert not b.is_on_grid(Point(1, 16))
 
+    def test_point_grid_covers_border(self):
+        for r in range(BOARD_SIZE + 2):
+            for c in range(BOARD_SIZE + 2):
+                assert POINT_GRID[r][c] == Point(r, c)
+        assert POINT_GRID[8][8] is POINT_GRID[8][8]
 
-class TestGomokuGameState:
-    def test_initial_state(self):
-        g = GomokuGameState()
-        assert g.current_player is Player.BLACK
-        assert not g.is_over
-        assert g.winner is None
-        assert len(g.legal_moves()) == BOARD_SIZE * BOARD_SIZE
-
-    def test_alternating_turns(self):
-        g = GomokuGameState()
-        g.apply_move(Point(5, 5))
-        assert g.current_player is Player.WHITE
-        g.apply_move(Point(5, 6))
-        assert g.current_player is Player.BLACK
-
-    def test_horizontal_win(self):
-        g = GomokuGameState()
-        # Black: row 1, cols 1-5. White: row 2, cols 1-4.
-        for i in range(4):
-            g.apply_move(Point(1, i + 1))  # Black
-            g.apply_move(Point(2, i + 1))  # White
-        g.apply_move(Point(1, 5))  # Black wins
-        assert g.is_over
-        assert g.winner is Player.BLACK
-
-    def test_vertical_win(self):
-        g = GomokuGameState()
-        for i in range(4):
-            g.apply_move(Point(i + 1, 1))  # Black
-            g.apply_move(Point(i + 1, 2))  # White
-        g.apply_move(Point(5, 1))  # Black wins
-        assert g.is_over
-        assert g.winner is Player.BLACK
-
-    def test_diagonal_win(self):
-        g = GomokuGameState()
-        # Black on main diagonal (1,1)-(5,5), White on col 9
-        moves_black = [Point(i, i) for i in range(1, 6)]
-        moves_white = [Point(i, 9) for i in range(1, 5)]
-        for i in range(4):
-            g.apply_move(moves_black[i])
-            g.apply_move(moves_white[i])
-        g.apply_move(moves_black[4])  # Black wins
-        assert g.is_over
-        assert g.winner is Player.BLACK
-
-    def test_anti_diagonal_win(self):
-        g = GomokuGameState()
-        # Black: (1,5),(2,4),(3,3),(4,2),(5,1). White: col 9.
-        moves_black = [Point(i, 6 - i) for i in range(1, 6)]
-        moves_white = [Point(i, 9) for i in range(1, 5)]
-        for i in range(4):
-            g.apply_move(moves_black[i])
-            g.apply_move(moves_white[i])
-        g.apply_move(moves_black[4])
-        assert g.is_over
-        assert g.winner is Player.BLACK
+    def test_bits_track_stones(self):
+        b = Board()
+        b.place(Point(1, 1), Player.BLACK)
+        b.place(Point(15, 15), Player.WHITE)
+        c = b.clone()
+        assert b.bits(Player.BLACK) == 1 << (1 * BIT_STRIDE + 1)
+        assert b.bits(Player.WHITE) == 1 << (15 * BIT_STRIDE + 15)
+        b.remove(Point(1, 1))
+        assert b.bits(Player.BLACK) == 0
+        assert c.bits(Player.BLACK) != 0
+
+    def test_zobrist_roundtrip(self):
+        b = Board()
+        b.place(Point(8, 8), Player.BLACK)
+        before = b.zobrist_hash
+        b.place(Point(3, 4), Player.WHITE)
+        assert b.zobrist_hash != before
+        b.remove(Point(3, 4))
+        assert b.zobrist_hash == before
+        b.place(Point(3, 4), Player.BLACK)
+        assert b.clone().zobrist_hash == b.zobrist_hash
+        b.remove(Point(3, 4))
+        b.remove(Point(8, 8))
+        assert b.zobrist_hash == 0
+
+    @pytest.mark.parametrize("dr,dc", [(0, 1), (1, 0), (1, 1), (1, -1)])
+    def test_makes_five(self, dr, dc):
+        b = Board()
+        start = Point(6, 6)
+        for k in (0, 1, 3, 4):
+            b.place(Point(start.row + k * dr, start.col + k * dc), Player.BLACK)
+        gap = Point(start.row + 2 * dr, start.col + 2 * dc)
+        assert makes_five(b.bits(Player.BLACK), gap)
+        assert not makes_five(b.bits(Player.WHITE), gap)
+        assert not makes_five(b.bits(Player.BLACK), Point(1, 1))
+
+    def test_makes_five_does_not_wrap_rows(self):
+        b = Board()
+        for p in (Point(1, 13), Point(1, 14), Point(1, 15), Point(2, 1)):
+            b.place(p, Player.BLACK)
+        assert not makes_five(b.bits(Player.BLACK), Point(2, 2))
 
-    def test_no_premature_win(self):
+
+class TestGomokuGameState:
+    def test_initial_state(self, fresh_game):
+        assert fresh_game.current_player is Player.BLACK
+        assert not fresh_game.is_over
+        assert fresh_game.winner is None
+        assert len(fresh_game.legal_moves()) == BOARD_SIZE * BOARD_SIZE
+
+    def test_alternating_turns(self, fresh_game):
+        fresh_game.apply_move(Point(5, 5))
+        assert fresh_game.current_player is Player.WHITE
+        fresh_game.apply_move(Point(5, 6))
+        assert fresh_game.current_player is Player.BLACK
+
+    @pytest.mark.parametrize(
+        "black,white",
+        [
+            # Row 1, cols 1-5; White on row 2
+            ([Point(1, i) for i in range(1, 6)], [Point(2, i) for i in range(1, 5)]),
+            # Col 1, rows 1-5; White on col 2
+            ([Point(i, 1) for i in range(1, 6)], [Point(i, 2) for i in range(1, 5)]),
+            # Main diagonal (1,1)-(5,5); White on col 9
+            ([Point(i, i) for i in range(1, 6)], [Point(i, 9) for i in range(1, 5)]),
+            # Anti-diagonal (1,5)-(5,1); White on col 9
+            ([Point(i, 6 - i) for i in range(1, 6)], [Point(i, 9) for i in range(1, 5)]),
+        ],
+        ids=["horizontal", "vertical", "diagonal", "anti_diagonal"],
+    )
+    def test_win(self, fresh_game, black, white):
+        for b, w in zip(black, white):
+            fresh_game.apply_move(b)
+            fresh_game.apply_move(w)
+            assert not fresh_game.is_over
+        fresh_game.apply_move(black[4])  # Black wins
+        assert fresh_game.is_over
+        assert fresh_game.winner is Player.BLACK
+
+    def test_no_premature_win(self, fresh_game):
         """4 in a row should NOT trigger a win."""
-        g = GomokuGameState()
         for i in range(4):
-            g.apply_move(Point(1, i + 1))  # Black
-            g.apply_move(Point(2, i + 1))  # White
+            fresh_game.apply_move(Point(1, i + 1))  # Black
+            fresh_game.apply_move(Point(2, i + 1))  # White
         # Black has 4 in a row on row 1, but not 5
-        assert not g.is_over
+        assert not fresh_game.is_over
 
-    def test_undo_move(self):
-        g = GomokuGameState()
-        g.apply_move(Point(5, 5))
-        g.apply_move(Point(5, 6))
-        move = g.undo_move()
+    def test_undo_move(self, fresh_game):
+        fresh_game.apply_move(Point(5, 5))
+        fresh_game.apply_move(Point(5, 6))
+        move = fresh_game.undo_move()
         assert move is not None
         assert move.point == Point(5, 6)
-        assert g.current_player is Player.WHITE
-        assert g.board.is_empty(Point(5, 6))
+        assert fresh_game.current_player is Player.WHITE
+        assert fresh_game.board.is_empty(Point(5, 6))
 
-    def test_undo_reverses_win(self):
-        g = GomokuGameState()
+    def test_undo_reverses_win(self, fresh_game):
         for i in range(4):
-            g.apply_move(Point(1, i + 1))
-            g.apply_move(Point(2, i + 1))
-        g.apply_move(Point(1, 5))  # Black wins
-        assert g.is_over
-
-        g.undo_move()
-        assert not g.is_over
-        assert g.winner is None
-
-    def test_undo_empty_returns_none(self):
-        g = GomokuGameState()
-        assert g.undo_move() is None
-
-    def test_cannot_play_on_occupied(self):
-        g = GomokuGameState()
-        g.apply_move(Point(5, 5))
+            fresh_game.apply_move(Point(1, i + 1))
+            fresh_game.apply_move(Point(2, i + 1))
+        fresh_game.apply_move(Point(1, 5))  # Black wins
+        assert fresh_game.is_over
+
+        fresh_game.undo_move()
+        assert not fresh_game.is_over
+        assert fresh_game.winner is None
+
+    def test_undo_empty_returns_none(self, fresh_game):
+        assert fresh_game.undo_move() is None
+
+    def test_cannot_play_on_occupied(self, fresh_game):
+        fresh_game.apply_move(Point(5, 5))
         with pytest.raises(AssertionError):
-            g.apply_move(Point(5, 5))
+            fresh_game.apply_move(Point(5, 5))
 
-    def test_cannot_play_after_game_over(self):
-        g = GomokuGameState()
+    def test_cannot_play_after_game_over(self, fresh_game):
         for i in range(4):
-            g.apply_move(Point(1, i + 1))
-            g.apply_move(Point(2, i + 1))
-        g.apply_move(Point(1, 5))  # Black wins
+            fresh_game.apply_move(Point(1, i + 1))
+            fresh_game.apply_move(Point(2, i + 1))
+        fresh_game.apply_move(Point(1, 5))  # Black wins
         with pytest.raises(AssertionError):
-            g.apply_move(Point(3, 1))
-
-    def test_legal_moves_empty_after_game_over(self):
-        g = GomokuGameState()
+            fresh_game.apply_move(Point(3, 1))
+
+    def test_zobrist_hash_restored_by_undo(self, fresh_game):
+        h0 = fresh_game.zobrist_hash
+        fresh_game.apply_move(Point(5, 5))
+        h1 = fresh_game.zobrist_hash
+        assert h1 != h0
+        fresh_game.apply_move(Point(5, 6))
+        fresh_game.undo_move()
+        assert fresh_game.zobrist_hash == h1
+        fresh_game.undo_move()
+        assert fresh_game.zobrist_hash == h0
+
+    def test_zobrist_hash_transposition(self):
+        a = GomokuGameState()
+        for p in (Point(5, 5), Point(1, 1), Point(6, 6), Point(2, 2)):
+            a.apply_move(p)
+        b = GomokuGameState()
+        for p in (Point(6, 6), Point(2, 2), Point(5, 5), Point(1, 1)):
+            b.apply_move(p)
+        assert a.zobrist_hash == b.zobrist_hash
+
+    def test_clone_is_independent(self, fresh_game):
+        fresh_game.apply_move(Point(5, 5))
+        c = fresh_game.clone()
+        c.apply_move(Point(5, 6))
+        assert len(fresh_game.moves) == 1
+        assert fresh_game.board.is_empty(Point(5, 6))
+        assert fresh_game.current_player is Player.WHITE
+        assert c.current_player is Player.BLACK
+
+    def test_from_coords(self):
+        g = GomokuGameState.from_coords(["H8", "a1", "I8"])
+        assert [m.point for m in g.moves] == [Point(8, 8), Point(1, 1), Point(8, 9)]
+        assert g.board.get(Point(1, 1)) is Player.WHITE
+        with pytest.raises(ValueError):
+            GomokuGameState.from_coords(["Z9"])
+
+    def test_legal_moves_cached_consistency(self, fresh_game):
+        fresh_game.apply_move(Point(8, 8))
+        fresh_game.apply_move(Point(1, 15))
+        first = fresh_game.legal_moves()
+        assert fresh_game.legal_moves() == first
+        assert first == [
+            Point(r, c) for r in range(1, BOARD_SIZE + 1) for c in range(1, BOARD_SIZE + 1)
+            if fresh_game.board.is_empty(Point(r, c))
+        ]
+        first.clear()  # callers get their own list
+        assert len(fresh_game.legal_moves()) == BOARD_SIZE * BOARD_SIZE - 2
+        fresh_game.undo_move()
+        assert Point(1, 15) in fresh_game.legal_moves()
+        assert fresh_game.clone().legal_moves() == fresh_game.legal_moves()
+
+    def test_legal_moves_empty_after_game_over(self, fresh_game):
         for i in range(4):
-            g.apply_move(Point(1, i + 1))
-            g.apply_move(Point(2, i + 1))
-        g.apply_move(Point(1, 5))
-        assert g.legal_moves() == []
+            fresh_game.apply_move(Point(1, i + 1))
+            fresh_game.apply_move(Point(2, i + 1))
+        fresh_game.apply_move(Point(1, 5))
+        assert fresh_game.legal_moves() == []
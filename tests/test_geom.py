@@ -0,0 +1,20 @@
+from betagomoku.game.board import ALL_POINTS, BOARD_SIZE
+from betagomoku.game.geom import NEIGH1_POINTS, NEIGH2_POINTS, RING2_POINTS
+from betagomoku.game.types import Point
+
+
+def test_neighbour_tables_centre():
+    centre = Point(8, 8)
+    assert len(NEIGH1_POINTS[centre]) == 8
+    assert len(RING2_POINTS[centre]) == 16
+    assert set(NEIGH2_POINTS[centre]) == set(NEIGH1_POINTS[centre]) | set(RING2_POINTS[centre])
+
+
+def test_neighbour_tables_stay_on_grid():
+    assert set(NEIGH2_POINTS[Point(1, 1)]) == {
+        Point(r, c) for r in (1, 2, 3) for c in (1, 2, 3)
+    } - {Point(1, 1)}
+    for p in ALL_POINTS:
+        for q in NEIGH2_POINTS[p]:
+            assert 1 <= q.row <= BOARD_SIZE and 1 <= q.col <= BOARD_SIZE
+            assert max(abs(q.row - p.row), abs(q.col - p.col)) <= 2
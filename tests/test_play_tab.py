@@ -1,5 +1,18 @@
-from betagomoku.game.types import Player
-from betagomoku.ui.play_tab import GameSession, _new_game_with_color
+import asyncio
+import threading
+
+from betagomoku.agent.baseline_agent import evaluate
+from betagomoku.agent.random_agent import RandomAgent
+from betagomoku.game.types import Player, Point
+from betagomoku.ui.play_tab import (
+    _COLOR_CHOICES,
+    GameSession,
+    _apply_human_move,
+    _cached_evaluate,
+    _new_game_with_color,
+    _resign,
+    _undo_move,
+)
 
 
 def test_new_game_as_black():
@@ -21,15 +34,183 @@ def test_new_game_as_white_ai_goes_first():
     assert "You are White" in result[4]
 
 
-def test_new_game_random_assigns_valid_color():
+def test_new_game_random_assigns_valid_color(monkeypatch):
+    # Sample the draw itself rather than starting 50 games
+    colors_seen = {_COLOR_CHOICES["Random"]() for _ in range(50)}
+    # With 50 tries, we should see both colors
+    assert colors_seen == {Player.BLACK, Player.WHITE}
+
+    # A "Random" new game takes whichever colour the draw picks
     session = GameSession()
-    colors_seen = set()
-    for _ in range(50):
+    for drawn in (Player.BLACK, Player.WHITE):
+        monkeypatch.setattr("betagomoku.ui.play_tab._random.choice", lambda seq: drawn)
         _new_game_with_color("Random", "RandomAgent", session)
-        colors_seen.add(session.human_player)
-    # With 50 tries, we should see both colors
-    assert Player.BLACK in colors_seen
-    assert Player.WHITE in colors_seen
+        assert session.human_player is drawn
+        assert len(session.game.moves) == (0 if drawn is Player.BLACK else 1)
+
+
+def test_agent_reused_across_games():
+    session = GameSession()
+    _new_game_with_color("Black", "BaselineAgent (d=1)", session)
+    first = session.agent
+    _new_game_with_color("Black", "BaselineAgent (d=1)", session)
+    assert session.agent is first
+    assert first.depth == 1
+
+
+def test_apply_human_move_plays_ai_reply():
+    session = GameSession(agent=RandomAgent())
+    result = asyncio.run(_apply_human_move("H8", session))
+    assert len(session.game.moves) == 2
+    assert result[3] is session
+    assert result[4] == ""
+
+
+def test_rejected_click_during_search_keeps_render():
+    searching = threading.Event()
+    release = threading.Event()
+
+    class SlowAgent(RandomAgent):
+        def select_move(self, game_state):
+            searching.set()
+            release.wait(5)
+            return super().select_move(game_state)
+
+    session = GameSession(agent=SlowAgent())
+
+    async def overlapping_clicks():
+        first = asyncio.create_task(_apply_human_move("H8", session))
+        await asyncio.get_running_loop().run_in_executor(None, searching.wait, 5)
+        # Second click while the AI is still thinking: rejected
+        second = await _apply_human_move("I9", session)
+        release.set()
+        return await first, second
+
+    first, second = asyncio.run(overlapping_clicks())
+    assert "AI's turn" in second[1]
+    assert len(session.game.moves) == 2
+    # The accepted move still renders the board and move table
+    assert "<svg" in first[0]
+    assert first[2] == session.move_history_table
+    assert first[3] is session
+
+
+def test_new_game_during_search_discards_stale_reply():
+    searching = threading.Event()
+    release = threading.Event()
+
+    class SlowAgent(RandomAgent):
+        def select_move(self, game_state):
+            searching.set()
+            release.wait(5)
+            return super().select_move(game_state)
+
+    session = GameSession(agent=SlowAgent())
+
+    async def new_game_mid_search():
+        pending = asyncio.create_task(_apply_human_move("H8", session))
+        await asyncio.get_running_loop().run_in_executor(None, searching.wait, 5)
+        _new_game_with_color("Black", "RandomAgent", session)
+        release.set()
+        return await pending
+
+    stale = asyncio.run(new_game_mid_search())
+    assert all(out == {"__type__": "update"} for out in stale)
+    # The old search's reply never lands on the new game
+    assert session.game.moves == []
+    assert session.human_player is Player.BLACK
+    assert session.status_text == "Your turn (Black)"
+
+
+def test_invalid_coordinate_leaves_move_table_untouched():
+    session = GameSession(agent=RandomAgent())
+    result = asyncio.run(_apply_human_move("Z99", session))
+    assert "Invalid coordinate" in result[1]
+    assert result[0] == {"__type__": "update"}
+    assert result[2] == {"__type__": "update"}
+
+
+def test_resign_leaves_move_table_untouched():
+    session = GameSession(agent=RandomAgent())
+    asyncio.run(_apply_human_move("H8", session))
+    result = _resign(session)
+    assert session.game.winner is Player.WHITE
+    assert result[2] == {"__type__": "update"}
+
+
+def test_undo_and_resign_wait_for_pending_search():
+    searching = threading.Event()
+    release = threading.Event()
+    during: list = []
+
+    class SlowAgent(RandomAgent):
+        def select_move(self, game_state):
+            searching.set()
+            release.wait(5)
+            return super().select_move(game_state)
+
+    session = GameSession(agent=SlowAgent())
+
+    async def clicks_mid_search():
+        pending = asyncio.create_task(_apply_human_move("H8", session))
+        await asyncio.get_running_loop().run_in_executor(None, searching.wait, 5)
+        during.append(_undo_move(session))
+        during.append(_resign(session))
+        release.set()
+        return await pending
+
+    asyncio.run(clicks_mid_search())
+    for result in during:
+        assert "AI's turn" in result[1]
+        assert result[0] == {"__type__": "update"}
+    assert len(session.game.moves) == 2
+    assert not session.game.is_over
+
+
+def test_undo_keeps_ai_opening_move():
+    session = GameSession()
+    _new_game_with_color("White", "RandomAgent", session)
+    result = _undo_move(session)
+    assert result[1] == "Nothing to undo."
+    assert len(session.game.moves) == 1
+    assert session.game.current_player is Player.WHITE
+
+
+def test_cached_evaluate_matches_evaluate():
+    session = GameSession()
+    assert _cached_evaluate(session.game) is None
+    session.game.apply_move(Point(8, 8))
+    session.game.apply_move(Point(8, 9))
+    assert _cached_evaluate(session.game) == evaluate(session.game)
+    assert _cached_evaluate(session.game) == evaluate(session.game)
+
+
+def test_ai_searches_on_session_thread():
+    threads = set()
+
+    class RecordingAgent(RandomAgent):
+        def select_move(self, game_state):
+            threads.add(threading.get_ident())
+            return super().select_move(game_state)
+
+    session = GameSession(agent=RecordingAgent())
+    asyncio.run(_apply_human_move("H8", session))
+    asyncio.run(_apply_human_move("A1", session))
+    assert len(threads) == 1
+    assert threading.get_ident() not in threads
+
+
+def test_move_history_table_tracks_undo_and_reset():
+    session = GameSession()
+    for p in (Point(8, 8), Point(8, 9), Point(7, 7)):
+        session.game.apply_move(p, elapsed=1.0)
+    assert [row[2] for row in session.move_history_table] == ["H8", "I8", "G7"]
+    session.game.undo_move()
+    session.game.apply_move(Point(1, 1))
+    assert [row[2] for row in session.move_history_table] == ["H8", "I8", "A1"]
+    assert session.move_history_table[-1][3] == "—"
+    session.reset()
+    assert session.move_history_table == []
 
 
 def test_game_over_banner_win():
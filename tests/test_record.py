@@ -10,6 +10,7 @@ from betagomoku.game.record import (
     SAVED_GAMES_DIR,
     list_saved_games,
     load_game,
+    record_points,
     replay_to_move,
     save_game,
 )
@@ -32,9 +33,10 @@ def cleanup_saved_files():
     yield
     # Remove files created during tests (identified by test player names)
     if SAVED_GAMES_DIR.exists():
-        for f in os.listdir(SAVED_GAMES_DIR):
-            if "TestBlack" in f or "TestWhite" in f:
-                os.remove(SAVED_GAMES_DIR / f)
+        with os.scandir(SAVED_GAMES_DIR) as it:
+            for entry in it:
+                if "TestBlack" in entry.name or "TestWhite" in entry.name:
+                    os.remove(entry.path)
 
 
 class TestSaveGame:
@@ -64,6 +66,34 @@ class TestSaveGame:
         data = load_game(filename)
         assert data["result"] == "Test result"
 
+    def test_save_with_hash_suffix_dedupes(self, sample_game):
+        suffix = f"{sample_game.zobrist_hash:016x}"
+        first = save_game(sample_game, "TestBlack", "TestWhite", hash_suffix=suffix)
+        second = save_game(sample_game, "TestBlack", "TestWhite", hash_suffix=suffix)
+        assert first == second
+        assert first.endswith(f"_{suffix}.json")
+
+    def test_save_with_hash_suffix_keeps_different_results(self, sample_game):
+        suffix = f"{sample_game.zobrist_hash:016x}"
+        first = save_game(sample_game, "TestBlack", "TestWhite", hash_suffix=suffix)
+        second = save_game(
+            sample_game, "TestBlack", "TestWhite", result="Black resigns", hash_suffix=suffix,
+        )
+        assert load_game(first)["result"] == "In progress"
+        assert load_game(second)["result"] == "Black resigns"
+
+    def test_save_with_hash_suffix_dedupes_collision_named_files(self, sample_game):
+        suffix = f"{sample_game.zobrist_hash:016x}"
+        save_game(sample_game, "TestBlack", "TestWhite", hash_suffix=suffix)
+        # Same position, different result: written next to the first save
+        saved = {
+            save_game(
+                sample_game, "TestBlack", "TestWhite", result="Black resigns", hash_suffix=suffix,
+            )
+            for _ in range(3)
+        }
+        assert len(saved) == 1
+
 
 class TestLoadGame:
     def test_load_roundtrip(self, sample_game):
@@ -84,8 +114,40 @@ class TestListSavedGames:
         # Files are named with timestamps, so reverse sort = newest first
         assert files == sorted(files, reverse=True)
 
+    def test_list_sees_new_save(self, sample_game):
+        before = list_saved_games()
+        filename = save_game(sample_game, "TestBlack", "TestWhite")
+        assert filename not in before
+        assert filename in list_saved_games()
+
 
 class TestReplayToMove:
+    def test_record_points_stop(self, sample_game):
+        record = load_game(save_game(sample_game, "TestBlack", "TestWhite"))
+        assert record_points(record, 2) == [Point(8, 8), Point(8, 9)]
+        del record["moves_rc"]
+        assert record_points(record, 2) == [Point(8, 8), Point(8, 9)]
+        assert record_points(record, 0) == []
+
+    def test_invalid_moves_rc_pairs_are_skipped(self):
+        record = {
+            "moves": ["H8", "??", "??", "??", "G7"],
+            "moves_rc": [[8, 8], [0, 3], [16, 1], ["8", 9], [7, 7]],
+        }
+        assert record_points(record) == [Point(8, 8), None, None, None, Point(7, 7)]
+        game = replay_to_move(record, 4)
+        assert [m.point for m in game.moves] == [Point(8, 8), Point(7, 7)]
+
+    def test_uses_moves_rc(self, sample_game):
+        filename = save_game(sample_game, "TestBlack", "TestWhite")
+        record = load_game(filename)
+        assert record["moves_rc"] == [[8, 8], [8, 9], [7, 7]]
+        assert record_points(record) == [Point(8, 8), Point(8, 9), Point(7, 7)]
+        # Records saved before moves_rc existed replay the same way
+        del record["moves_rc"]
+        game = replay_to_move(record, 2)
+        assert [m.point for m in game.moves] == [Point(8, 8), Point(8, 9), Point(7, 7)]
+
     def test_empty_board(self, sample_game):
         filename = save_game(sample_game, "TestBlack", "TestWhite")
         record = load_game(filename)
@@ -1,11 +1,10 @@
-from betagomoku.game.board import BOARD_SIZE, GomokuGameState
+from betagomoku.game.board import BOARD_SIZE
 from betagomoku.game.types import Player, Point
 from betagomoku.ui.board_component import render_board_svg
 
 
-def test_empty_board_svg():
-    g = GomokuGameState()
-    html = render_board_svg(g)
+def test_empty_board_svg(fresh_game):
+    html = render_board_svg(fresh_game)
     assert "<svg" in html
     assert "</svg>" in html
     assert "gomoku-board" in html
@@ -13,61 +12,54 @@ def test_empty_board_svg():
     assert html.count('class="board-click"') == BOARD_SIZE * BOARD_SIZE
 
 
-def test_svg_with_stones():
-    g = GomokuGameState()
-    g.apply_move(Point(5, 5))  # Black
-    g.apply_move(Point(5, 6))  # White
-    html = render_board_svg(g)
+def test_svg_with_stones(fresh_game):
+    fresh_game.apply_move(Point(5, 5))  # Black
+    fresh_game.apply_move(Point(5, 6))  # White
+    html = render_board_svg(fresh_game)
     # 2 stones placed, so 2 fewer click targets
     assert html.count('class="board-click"') == BOARD_SIZE * BOARD_SIZE - 2
 
 
-def test_svg_not_clickable_when_game_over():
-    g = GomokuGameState()
+def test_svg_not_clickable_when_game_over(fresh_game):
     for i in range(4):
-        g.apply_move(Point(1, i + 1))
-        g.apply_move(Point(2, i + 1))
-    g.apply_move(Point(1, 5))  # Black wins
-    html = render_board_svg(g)
+        fresh_game.apply_move(Point(1, i + 1))
+        fresh_game.apply_move(Point(2, i + 1))
+    fresh_game.apply_move(Point(1, 5))  # Black wins
+    html = render_board_svg(fresh_game)
     assert html.count('class="board-click"') == 0
 
 
-def test_svg_not_clickable_when_disabled():
-    g = GomokuGameState()
-    html = render_board_svg(g, clickable=False)
+def test_svg_not_clickable_when_disabled(fresh_game):
+    html = render_board_svg(fresh_game, clickable=False)
     assert html.count('class="board-click"') == 0
 
 
-def test_game_over_banner_displayed():
-    g = GomokuGameState()
+def test_game_over_banner_displayed(fresh_game):
     for i in range(4):
-        g.apply_move(Point(1, i + 1))
-        g.apply_move(Point(2, i + 1))
-    g.apply_move(Point(1, 5))  # Black wins
-    html = render_board_svg(g, game_over_message="You win!")
+        fresh_game.apply_move(Point(1, i + 1))
+        fresh_game.apply_move(Point(2, i + 1))
+    fresh_game.apply_move(Point(1, 5))  # Black wins
+    html = render_board_svg(fresh_game, game_over_message="You win!")
     assert "You win!" in html
     # Green color for win
     assert "#4ADE80" in html
 
 
-def test_game_over_banner_ai_wins():
-    g = GomokuGameState()
-    html = render_board_svg(g, game_over_message="AI wins!")
+def test_game_over_banner_ai_wins(fresh_game):
+    html = render_board_svg(fresh_game, game_over_message="AI wins!")
     # Red color for loss
     assert "#F87171" in html
 
 
-def test_game_over_banner_draw():
-    g = GomokuGameState()
-    html = render_board_svg(g, game_over_message="Draw!")
+def test_game_over_banner_draw(fresh_game):
+    html = render_board_svg(fresh_game, game_over_message="Draw!")
     assert "Draw!" in html
     assert "#FFFFFF" in html
 
 
-def test_no_inline_script():
+def test_no_inline_script(fresh_game):
     """Gradio strips <script> from gr.HTML, so we must not embed it."""
-    g = GomokuGameState()
-    html = render_board_svg(g)
+    html = render_board_svg(fresh_game)
     assert "<script>" not in html
 
 
@@ -77,15 +69,13 @@ def test_click_js_exported():
     assert "coord-input" in BOARD_CLICK_JS
 
 
-def test_eval_bar_present_when_score_provided():
-    g = GomokuGameState()
-    html = render_board_svg(g, eval_score=5000)
+def test_eval_bar_present_when_score_provided(fresh_game):
+    html = render_board_svg(fresh_game, eval_score=5000)
     assert 'class="eval-bar"' in html
     assert "inline-flex" in html
 
 
-def test_eval_bar_absent_when_score_none():
-    g = GomokuGameState()
-    html = render_board_svg(g, eval_score=None)
+def test_eval_bar_absent_when_score_none(fresh_game):
+    html = render_board_svg(fresh_game, eval_score=None)
     assert 'class="eval-bar"' not in html
     assert "inline-flex" not in html
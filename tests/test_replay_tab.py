@@ -0,0 +1,94 @@
+import asyncio
+
+from betagomoku.agent.baseline_agent import evaluate
+from betagomoku.game.record import replay_to_move
+from betagomoku.ui.replay_tab import (
+    ReplayState,
+    _jump_start,
+    _render_replay_board,
+    _step_backward,
+    _step_forward,
+)
+
+RECORD = {
+    "black": "B",
+    "white": "W",
+    "result": "Black wins",
+    "moves": ["H8", "A1", "I8", "A2", "J8"],
+}
+
+
+def make_state() -> ReplayState:
+    state = ReplayState()
+    state.load(RECORD)
+    return state
+
+
+def test_step_forward_and_back():
+    state = make_state()
+    asyncio.run(_step_forward(state))
+    asyncio.run(_step_forward(state))
+    assert state.move_index == 1
+    assert [row[2] for row in state.move_table] == ["H8", "A1"]
+    asyncio.run(_step_backward(state))
+    assert state.move_index == 0
+
+
+def test_burst_of_steps_renders_once():
+    state = make_state()
+
+    async def burst():
+        return await asyncio.gather(*(_step_forward(state) for _ in range(3)))
+
+    results = asyncio.run(burst())
+    assert state.move_index == 2
+    assert [r[0] == {"__type__": "update"} for r in results] == [True, True, False]
+    assert results[-1][0] == _render_replay_board(state)
+
+
+def test_render_is_cached_per_position():
+    state = make_state()
+    state.goto(2)
+    first = _render_replay_board(state)
+    assert _render_replay_board(state) is first
+    state.goto(1)
+    assert _render_replay_board(state) != first
+
+
+def test_seek_matches_replay_from_scratch():
+    state = make_state()
+    for index in (3, 0, 4, -1, 2, 4):
+        state.goto(index)
+        game = state.seek()
+        expected = replay_to_move(RECORD, index)
+        assert [m.point for m in game.moves] == [m.point for m in expected.moves]
+        assert game.is_over == expected.is_over
+
+
+def test_evaluation_is_memoized_per_position():
+    state = make_state()
+    state.goto(2)
+    game = state.seek()
+    assert state.evaluation(game) == evaluate(game)
+    assert state.evals == {game.zobrist_hash: evaluate(game)}
+
+
+def test_status_and_table_follow_goto():
+    state = ReplayState()
+    assert state.status_text == "Load a game to begin."
+    state.load(RECORD)
+    assert state.status_text == "B (Black) vs W (White) | Result: Black wins | Start"
+    assert state.move_table == []
+    state.goto(4)
+    assert state.status_text.endswith("| Move 5/5")
+    assert len(state.move_table) == 5
+
+
+def test_noop_clicks_skip_all_outputs():
+    skip = {"__type__": "update"}
+    state = make_state()
+    assert _jump_start(state)[:3] == (skip, skip, skip)
+    assert asyncio.run(_step_backward(state))[:3] == (skip, skip, skip)
+    state.goto(4)
+    assert asyncio.run(_step_forward(state))[:3] == (skip, skip, skip)
+    assert asyncio.run(_step_forward(ReplayState()))[:3] == (skip, skip, skip)
@@ -16,3 +16,11 @@ def test_point_is_namedtuple():
     assert p.row == 3
     assert p.col == 5
     assert p == Point(3, 5)
+
+
+def test_off_grid_points_stay_distinct():
+    # Line walks step one cell past the edge and rely on bounds checks, so an
+    # off-grid Point must never alias an on-grid one
+    assert Point(1, 16) != Point(2, 1)
+    assert Point(0, 15) != Point(1, 0)
+    assert Point(1, 0) < Point(1, 1) < Point(1, 16) < Point(2, 1)